@@ -5,10 +5,15 @@ import yaml
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
+from functools import cached_property
 
 from .exceptions import ConfigurationError
 
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
 @dataclass
 class CreatureArchetypeConfig:
     """Configuration for creature archetype parameters."""
@@ -33,6 +38,15 @@ class CreatureArchetypeConfig:
     max_fertility_age_cycles: Dict[str, int]
     lifespan_cycles_min: int
     lifespan_cycles_max: int
+    
+    @cached_property
+    def fertility_window_cycles(self) -> Dict[str, int]:
+        """Cycles from birth until the fertility window closes, per sex (truncated, computed once)."""
+        cycles_per_year = 365.25 / self.menstrual_cycle_days
+        return {
+            sex: int(years * cycles_per_year)
+            for sex, years in self.max_fertility_age_years.items()
+        }
 
 
 @dataclass
@@ -73,6 +87,12 @@ class SimulationConfig:
     traits: List[TraitConfig]
     raw_config: Dict[str, Any]  # Store raw config for database storage
     mode: str = 'quiet'  # Output mode: 'quiet', 'monitor', or 'debug'
+    workers: int = 1  # Worker processes for offspring creation (1 = in-process)
+    
+    @cached_property
+    def raw_config_json(self) -> str:
+        """Compact JSON text of raw_config, serialized once and reused by every simulation run from this config."""
+        return json.dumps(self.raw_config, separators=(',', ':'))
 
 
 def load_config(config_path: str) -> SimulationConfig:
@@ -99,12 +119,31 @@ def load_config(config_path: str) -> SimulationConfig:
             if path.suffix.lower() == '.json':
                 raw_config = json.load(f)
             else:
-                raw_config = yaml.safe_load(f)
+                raw_config = yaml.load(f, Loader=YAML_LOADER)
     except (json.JSONDecodeError, yaml.YAMLError) as e:
         raise ConfigurationError(f"Failed to parse configuration file: {e}") from e
     except Exception as e:
         raise ConfigurationError(f"Failed to read configuration file: {e}") from e
     
+    return load_config_from_dict(raw_config)
+
+
+def load_config_from_dict(raw_config: Dict[str, Any]) -> SimulationConfig:
+    """
+    Validate and build configuration from an already-parsed dictionary.
+    
+    The dictionary is normalized in place (derived cycle counts, normalized
+    frequencies) and kept as the config's raw_config.
+    
+    Args:
+        raw_config: Configuration dictionary as parsed from YAML or JSON
+        
+    Returns:
+        Validated SimulationConfig object
+        
+    Raises:
+        ConfigurationError: If configuration is invalid
+    """
     # Validate and normalize
     validate_config(raw_config)
     normalize_config(raw_config)
@@ -503,6 +542,11 @@ def build_config(raw_config: Dict[str, Any]) -> SimulationConfig:
     if mode not in ['quiet', 'monitor', 'debug']:
         raise ConfigurationError(f"mode must be 'quiet', 'monitor', or 'debug', got '{mode}'")
     
+    # Get offspring worker processes (default to 1, i.e. no worker pool)
+    workers = raw_config.get('workers', 1)
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ConfigurationError(f"workers must be a positive integer, got {workers!r}")
+    
     return SimulationConfig(
         seed=raw_config['seed'],
         years=years,
@@ -516,6 +560,7 @@ def build_config(raw_config: Dict[str, Any]) -> SimulationConfig:
         breeders=breeder_config,
         traits=traits,
         raw_config=raw_config,
-        mode=mode
+        mode=mode,
+        workers=workers
     )
 
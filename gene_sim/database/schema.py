@@ -204,6 +204,7 @@ def create_schema(conn: sqlite3.Connection) -> None:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_creatures_parents ON creatures(parent1_id, parent2_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_creatures_breeding_eligibility ON creatures(simulation_id, sex, birth_cycle, is_alive)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_creatures_inbreeding ON creatures(simulation_id, inbreeding_coefficient)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_creatures_breeder ON creatures(breeder_id)")
         
         # Creature genotypes indexes
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_creature_genotypes_trait ON creature_genotypes(trait_id)")
@@ -216,6 +217,8 @@ def create_schema(conn: sqlite3.Connection) -> None:
         # Generation genotype frequencies indexes
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_genotype_freq_generation ON generation_genotype_frequencies(simulation_id, generation)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_genotype_freq_trait ON generation_genotype_frequencies(trait_id)")
+        # Per-trait time series (WHERE simulation_id = ? AND trait_id = ? ORDER BY generation, genotype)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_genotype_freq_sim_trait ON generation_genotype_frequencies(simulation_id, trait_id, generation, genotype)")
         
         # Generation trait stats indexes
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_trait_stats_generation ON generation_trait_stats(simulation_id, generation)")
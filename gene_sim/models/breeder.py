@@ -1,5 +1,6 @@
 """Breeder models for selecting mating pairs."""
 
+import inspect
 from abc import ABC, abstractmethod
 from typing import List, Tuple, Optional, TYPE_CHECKING
 import numpy as np
@@ -11,9 +12,35 @@ else:
     from .creature import Creature
 
 
+def _pick(candidates: List['Creature'], rng: np.random.Generator) -> 'Creature':
+    """
+    Pick one candidate uniformly at random.
+    
+    Equivalent to rng.choice(candidates) draw for draw (choice draws the same bounded
+    integer), but indexes the list directly instead of converting it to an object
+    array on every call, which made each pick O(len(candidates)).
+    
+    Args:
+        candidates: Non-empty list to pick from
+        rng: Random number generator
+        
+    Returns:
+        The selected candidate
+    """
+    return candidates[rng.integers(len(candidates))]
+
+
+def _freeze(entries: List[dict]) -> tuple:
+    """Hashable form of a list of small config dicts (target/undesirable entries)."""
+    return tuple(tuple(sorted(entry.items())) for entry in entries)
+
+
 class Breeder(ABC):
     """Abstract base class for breeder strategies."""
     
+    # (trait_id, phenotype) pairs a candidate must all match; set by targeting breeders
+    _target_pairs: tuple = ()
+    
     def __init__(
         self,
         undesirable_phenotypes: Optional[List[dict]] = None,
@@ -35,28 +62,91 @@ class Breeder(ABC):
         self.undesirable_genotypes = undesirable_genotypes or []
         self.avoid_undesirable_phenotypes = avoid_undesirable_phenotypes
         self.avoid_undesirable_genotypes = avoid_undesirable_genotypes
+        # Resolved once here so the cycle loop doesn't reflect on every call
+        self._select_pairs_wants_traits = 'traits' in inspect.signature(self.select_pairs).parameters
+        # Phenotypes memoized by (trait_id, genotype, sex) for the traits list last seen
+        self._phenotype_memo: dict = {}
+        self._phenotype_memo_traits: Optional[List] = None
+        # Target-phenotype matches memoized by (sex, genotypes at the target traits)
+        self._target_match_memo: dict = {}
+        # Candidate pools shared with identically configured breeders; Cycle.execute_cycle
+        # attaches one dict per cycle while pairs are selected and detaches it after
+        self._pool_cache: Optional[dict] = None
+    
+    def _follow_traits(self, traits: List) -> None:
+        """Drop the memoized lookups if the trait definitions changed."""
+        if traits is not self._phenotype_memo_traits:
+            self._phenotype_memo = {}
+            self._target_match_memo = {}
+            self._phenotype_memo_traits = traits
+    
+    def _phenotype(self, creature: 'Creature', trait_id: int, traits: List) -> Optional[str]:
+        """
+        Get a creature's phenotype for a trait, memoized across cycles.
+        
+        Genomes repeat heavily from cycle to cycle, so each (trait_id, genotype, sex)
+        combination is resolved against the trait definitions only once.
+        
+        Args:
+            creature: Creature to look up
+            trait_id: Trait to look up
+            traits: List of Trait objects
+            
+        Returns:
+            Phenotype string, or None if the creature lacks the trait, the trait is
+            unknown, or the genotype has no phenotype mapping
+        """
+        genome = creature.genome
+        if trait_id >= len(genome) or genome[trait_id] is None:
+            return None
+        
+        self._follow_traits(traits)
+        
+        key = (trait_id, genome[trait_id], creature.sex)
+        try:
+            return self._phenotype_memo[key]
+        except KeyError:
+            pass
+        trait = next((t for t in traits if t.trait_id == trait_id), None)
+        phenotype = trait.get_phenotype(genome[trait_id], creature.sex) if trait is not None else None
+        self._phenotype_memo[key] = phenotype
+        return phenotype
+    
+    def _matches_target_phenotypes(self, creature: 'Creature', traits: List) -> bool:
+        """
+        Check if creature matches every target phenotype.
+        
+        The answer depends only on the creature's sex and its genotypes at the
+        target traits, which few distinct combinations cover, so it is memoized
+        on exactly that key.
+        
+        Args:
+            creature: Creature to check
+            traits: List of Trait objects
+            
+        Returns:
+            True if all target phenotypes match (or none are set)
+        """
+        self._follow_traits(traits)
+        genome = creature.genome
+        key = (creature.sex, *[genome[trait_id] if trait_id < len(genome) else None
+                               for trait_id, _ in self._target_pairs])
+        try:
+            return self._target_match_memo[key]
+        except KeyError:
+            pass
+        matches = all(self._phenotype(creature, trait_id, traits) == phenotype
+                      for trait_id, phenotype in self._target_pairs)
+        self._target_match_memo[key] = matches
+        return matches
     
     def _has_undesirable_phenotype(self, creature: 'Creature', traits: List) -> bool:
         """Check if creature has any undesirable phenotype."""
         if not self.avoid_undesirable_phenotypes or not self.undesirable_phenotypes:
             return False
         
-        from .trait import Trait
-        
         for undesirable in self.undesirable_phenotypes:
-            trait_id = undesirable['trait_id']
-            undesirable_phenotype = undesirable['phenotype']
-            
-            if trait_id >= len(creature.genome) or creature.genome[trait_id] is None:
-                continue
-            
-            # Find trait to get phenotype mapping
-            trait = next((t for t in traits if t.trait_id == trait_id), None)
-            if trait is None:
-                continue
-            
-            actual_phenotype = trait.get_phenotype(creature.genome[trait_id], creature.sex)
-            if actual_phenotype == undesirable_phenotype:
+            if self._phenotype(creature, undesirable['trait_id'], traits) == undesirable['phenotype']:
                 return True
         
         return False
@@ -65,19 +155,52 @@ class Breeder(ABC):
         """Check if creature has any undesirable genotype."""
         if not self.avoid_undesirable_genotypes or not self.undesirable_genotypes:
             return False
-        
+        return self._carries_undesirable_genotype(creature)
+    
+    def _carries_undesirable_genotype(self, creature: 'Creature') -> bool:
+        """Check if creature carries any undesirable genotype, regardless of the avoidance flag."""
+        genome = creature.genome
         for undesirable in self.undesirable_genotypes:
             trait_id = undesirable['trait_id']
-            undesirable_genotype = undesirable['genotype']
-            
-            if trait_id >= len(creature.genome) or creature.genome[trait_id] is None:
-                continue
-            
-            if creature.genome[trait_id] == undesirable_genotype:
+            # Unset traits are None, which never equals a genotype string
+            if trait_id < len(genome) and genome[trait_id] == undesirable['genotype']:
                 return True
         
         return False
     
+    def _candidate_pools(
+        self,
+        eligible_males: List['Creature'],
+        eligible_females: List['Creature'],
+        traits: List
+    ) -> Tuple[List['Creature'], List['Creature'], List['Creature'], List['Creature']]:
+        """
+        Get this breeder's candidate pools, shared with identically configured breeders.
+        
+        Pools are shared through the cycle's pool cache, if one is attached; every
+        breeder sees the same eligible lists within a cycle. Without one they are
+        built for this call alone. Subclasses using this implement _pool_config (the
+        settings their pools depend on) and _build_candidate_pools.
+        
+        Args:
+            eligible_males: Eligible male creatures for this cycle
+            eligible_females: Eligible female creatures for this cycle
+            traits: List of Trait objects
+            
+        Returns:
+            Tuple of (filtered males, filtered females, matching males, matching females)
+        """
+        cache = self._pool_cache
+        if cache is None:
+            return self._build_candidate_pools(eligible_males, eligible_females, traits)
+        
+        key = (type(self), self._pool_config())
+        pools = cache.get(key)
+        if pools is None:
+            pools = self._build_candidate_pools(eligible_males, eligible_females, traits)
+            cache[key] = pools
+        return pools
+    
     def _filter_undesirable(self, creatures: List['Creature'], traits: List) -> List['Creature']:
         """Filter out creatures with undesirable phenotypes or genotypes."""
         filtered = []
@@ -141,8 +264,8 @@ class RandomBreeder(Breeder):
         
         pairs = []
         for _ in range(num_pairs):
-            male = rng.choice(filtered_males)
-            female = rng.choice(filtered_females)
+            male = _pick(filtered_males, rng)
+            female = _pick(filtered_females, rng)
             pairs.append((male, female))
         
         return pairs
@@ -201,8 +324,8 @@ class InbreedingAvoidanceBreeder(Breeder):
         max_attempts = num_pairs * 100  # Prevent infinite loops
         
         while len(pairs) < num_pairs and attempts < max_attempts:
-            male = rng.choice(filtered_males)
-            female = rng.choice(filtered_females)
+            male = _pick(filtered_males, rng)
+            female = _pick(filtered_females, rng)
             
             # Calculate potential offspring inbreeding coefficient
             potential_f = Creature.calculate_inbreeding_coefficient(male, female)
@@ -214,8 +337,8 @@ class InbreedingAvoidanceBreeder(Breeder):
         
         # If we couldn't find enough pairs, fill with random pairs
         while len(pairs) < num_pairs:
-            male = rng.choice(filtered_males)
-            female = rng.choice(filtered_females)
+            male = _pick(filtered_males, rng)
+            female = _pick(filtered_females, rng)
             pairs.append((male, female))
         
         return pairs
@@ -248,48 +371,73 @@ class KennelClubBreeder(Breeder):
         """
         super().__init__(undesirable_phenotypes, undesirable_genotypes, avoid_undesirable_phenotypes, avoid_undesirable_genotypes)
         self.target_phenotypes = target_phenotypes
+        # (trait_id, phenotype) pairs resolved once; every pair must match
+        self._target_pairs = tuple((t['trait_id'], t['phenotype']) for t in target_phenotypes)
         self.max_inbreeding_coefficient = max_inbreeding_coefficient
         self.required_phenotype_ranges = required_phenotype_ranges or []
     
-    def _matches_target_phenotypes(self, creature: 'Creature', traits: List) -> bool:
-        """Check if creature matches target phenotypes."""
-        from .trait import Trait
+    def _pool_config(self) -> tuple:
+        """Settings the candidate pools depend on."""
+        return (
+            _freeze(self.undesirable_genotypes),
+            self.avoid_undesirable_phenotypes and _freeze(self.undesirable_phenotypes),
+            self._target_pairs
+        )
+    
+    def _build_candidate_pools(
+        self,
+        eligible_males: List['Creature'],
+        eligible_females: List['Creature'],
+        traits: List
+    ) -> Tuple[List['Creature'], List['Creature'], List['Creature'], List['Creature']]:
+        """Filter undesirable creatures, then narrow to those matching the target phenotypes."""
+        # Kennel club breeder always filters out undesirable genotypes
+        # Also respects global avoidance flags for phenotypes
+        # Filters below build new lists, so the caller's lists are never mutated
+        # and need no defensive copy
+        filtered_males = eligible_males
+        filtered_females = eligible_females
         
-        for target in self.target_phenotypes:
-            trait_id = target['trait_id']
-            target_phenotype = target['phenotype']
-            
-            if trait_id >= len(creature.genome) or creature.genome[trait_id] is None:
-                return False
-            
-            # Find trait to get phenotype mapping
-            trait = next((t for t in traits if t.trait_id == trait_id), None)
-            if trait is None:
-                return False
-            
-            actual_phenotype = trait.get_phenotype(creature.genome[trait_id], creature.sex)
-            if actual_phenotype != target_phenotype:
-                return False
+        # Always filter undesirable genotypes (kennel club requirement), in one pass
+        # per sex however many genotypes are listed
+        # Note: We bypass the avoid_undesirable_genotypes flag check for kennel club
+        if self.undesirable_genotypes:
+            filtered_males = [m for m in filtered_males if not self._carries_undesirable_genotype(m)]
+            filtered_females = [f for f in filtered_females if not self._carries_undesirable_genotype(f)]
         
-        return True
+        # Filter undesirable phenotypes if global flag is enabled
+        if self.avoid_undesirable_phenotypes:
+            filtered_males = [m for m in filtered_males if not self._has_undesirable_phenotype(m, traits)]
+            filtered_females = [f for f in filtered_females if not self._has_undesirable_phenotype(f, traits)]
+        
+        # If filtering removed all candidates, fall back to original lists
+        if not filtered_males:
+            filtered_males = eligible_males
+        if not filtered_females:
+            filtered_females = eligible_females
+        
+        # Filter creatures that match target phenotypes
+        matching_males = [m for m in filtered_males if self._matches_target_phenotypes(m, traits)]
+        matching_females = [f for f in filtered_females if self._matches_target_phenotypes(f, traits)]
+        
+        # If no matches, fall back to filtered lists (which may be original if no filtering)
+        if not matching_males:
+            matching_males = filtered_males
+        if not matching_females:
+            matching_females = filtered_females
+        
+        return filtered_males, filtered_females, matching_males, matching_females
     
     def _matches_phenotype_ranges(self, creature: 'Creature', traits: List) -> bool:
         """Check if creature matches required phenotype ranges."""
-        from .trait import Trait
-        
         for range_req in self.required_phenotype_ranges:
             trait_id = range_req['trait_id']
             min_val = float(range_req['min'])
             max_val = float(range_req['max'])
             
-            if trait_id >= len(creature.genome) or creature.genome[trait_id] is None:
-                return False
-            
-            trait = next((t for t in traits if t.trait_id == trait_id), None)
-            if trait is None:
+            phenotype_str = self._phenotype(creature, trait_id, traits)
+            if phenotype_str is None:
                 return False
-            
-            phenotype_str = trait.get_phenotype(creature.genome[trait_id], creature.sex)
             try:
                 phenotype_val = float(phenotype_str)
                 if not (min_val <= phenotype_val <= max_val):
@@ -315,50 +463,17 @@ class KennelClubBreeder(Breeder):
         if traits is None:
             traits = []
         
-        # Kennel club breeder always filters out undesirable genotypes
-        # Also respects global avoidance flags for phenotypes
-        filtered_males = eligible_males.copy()
-        filtered_females = eligible_females.copy()
-        
-        # Always filter undesirable genotypes (kennel club requirement)
-        # Note: We bypass the avoid_undesirable_genotypes flag check for kennel club
-        if self.undesirable_genotypes:
-            for undesirable in self.undesirable_genotypes:
-                trait_id = undesirable['trait_id']
-                undesirable_genotype = undesirable['genotype']
-                filtered_males = [m for m in filtered_males 
-                                if trait_id >= len(m.genome) or m.genome[trait_id] is None or m.genome[trait_id] != undesirable_genotype]
-                filtered_females = [f for f in filtered_females 
-                                  if trait_id >= len(f.genome) or f.genome[trait_id] is None or f.genome[trait_id] != undesirable_genotype]
-        
-        # Filter undesirable phenotypes if global flag is enabled
-        if self.avoid_undesirable_phenotypes:
-            filtered_males = [m for m in filtered_males if not self._has_undesirable_phenotype(m, traits)]
-            filtered_females = [f for f in filtered_females if not self._has_undesirable_phenotype(f, traits)]
-        
-        # If filtering removed all candidates, fall back to original lists
-        if not filtered_males:
-            filtered_males = eligible_males
-        if not filtered_females:
-            filtered_females = eligible_females
-        
-        # Filter creatures that match target phenotypes
-        matching_males = [m for m in filtered_males if self._matches_target_phenotypes(m, traits)]
-        matching_females = [f for f in filtered_females if self._matches_target_phenotypes(f, traits)]
-        
-        # If no matches, fall back to filtered lists (which may be original if no filtering)
-        if not matching_males:
-            matching_males = filtered_males
-        if not matching_females:
-            matching_females = filtered_females
+        filtered_males, filtered_females, matching_males, matching_females = self._candidate_pools(
+            eligible_males, eligible_females, traits
+        )
         
         pairs = []
         attempts = 0
         max_attempts = num_pairs * 100
         
         while len(pairs) < num_pairs and attempts < max_attempts:
-            male = rng.choice(matching_males)
-            female = rng.choice(matching_females)
+            male = _pick(matching_males, rng)
+            female = _pick(matching_females, rng)
             
             # Check inbreeding limit if set
             if self.max_inbreeding_coefficient is not None:
@@ -379,8 +494,8 @@ class KennelClubBreeder(Breeder):
         
         # Fill remaining with random pairs if needed
         while len(pairs) < num_pairs:
-            male = rng.choice(filtered_males)
-            female = rng.choice(filtered_females)
+            male = _pick(filtered_males, rng)
+            female = _pick(filtered_females, rng)
             pairs.append((male, female))
         
         return pairs
@@ -409,63 +524,41 @@ class MillBreeder(Breeder):
         """
         super().__init__(undesirable_phenotypes, undesirable_genotypes, avoid_undesirable_phenotypes, avoid_undesirable_genotypes)
         self.target_phenotypes = target_phenotypes
+        # (trait_id, phenotype) pairs resolved once; every pair must match
+        self._target_pairs = tuple((t['trait_id'], t['phenotype']) for t in target_phenotypes)
     
-    def _matches_target_phenotypes(self, creature: 'Creature', traits: List) -> bool:
-        """Check if creature matches target phenotypes."""
-        from .trait import Trait
-        
-        for target in self.target_phenotypes:
-            trait_id = target['trait_id']
-            target_phenotype = target['phenotype']
-            
-            if trait_id >= len(creature.genome) or creature.genome[trait_id] is None:
-                return False
-            
-            trait = next((t for t in traits if t.trait_id == trait_id), None)
-            if trait is None:
-                return False
-            
-            actual_phenotype = trait.get_phenotype(creature.genome[trait_id], creature.sex)
-            if actual_phenotype != target_phenotype:
-                return False
-        
-        return True
+    def _pool_config(self) -> tuple:
+        """Settings the candidate pools depend on."""
+        return (
+            _freeze(self.undesirable_phenotypes),
+            self.avoid_undesirable_genotypes and _freeze(self.undesirable_genotypes),
+            self._target_pairs
+        )
     
-    def select_pairs(
+    def _build_candidate_pools(
         self,
         eligible_males: List['Creature'],
         eligible_females: List['Creature'],
-        num_pairs: int,
-        rng: np.random.Generator,
-        traits: List = None
-    ) -> List[Tuple['Creature', 'Creature']]:
-        """Select pairs based on target phenotypes. Mill breeders always avoid undesirable phenotypes."""
-        if not eligible_males or not eligible_females:
-            return []
-        
-        if traits is None:
-            traits = []
-        
+        traits: List
+    ) -> Tuple[List['Creature'], List['Creature'], List['Creature'], List['Creature']]:
+        """Filter undesirable creatures, then narrow to those matching the target phenotypes."""
         # Mill breeder always filters out undesirable phenotypes
         # Also respects global avoidance flag for genotypes
-        filtered_males = eligible_males.copy()
-        filtered_females = eligible_females.copy()
+        # Filters below build new lists, so the caller's lists are never mutated
+        # and need no defensive copy
+        filtered_males = eligible_males
+        filtered_females = eligible_females
         
         # Always filter undesirable phenotypes (mill requirement)
         # Note: We bypass the avoid_undesirable_phenotypes flag check for mill
         if self.undesirable_phenotypes:
-            from .trait import Trait
             for undesirable in self.undesirable_phenotypes:
                 trait_id = undesirable['trait_id']
                 undesirable_phenotype = undesirable['phenotype']
-                trait = next((t for t in traits if t.trait_id == trait_id), None)
-                if trait is not None:
-                    filtered_males = [m for m in filtered_males 
-                                    if trait_id >= len(m.genome) or m.genome[trait_id] is None or 
-                                    trait.get_phenotype(m.genome[trait_id], m.sex) != undesirable_phenotype]
-                    filtered_females = [f for f in filtered_females 
-                                      if trait_id >= len(f.genome) or f.genome[trait_id] is None or 
-                                      trait.get_phenotype(f.genome[trait_id], f.sex) != undesirable_phenotype]
+                filtered_males = [m for m in filtered_males
+                                if self._phenotype(m, trait_id, traits) != undesirable_phenotype]
+                filtered_females = [f for f in filtered_females
+                                  if self._phenotype(f, trait_id, traits) != undesirable_phenotype]
         
         # Filter undesirable genotypes if global flag is enabled
         if self.avoid_undesirable_genotypes:
@@ -488,10 +581,31 @@ class MillBreeder(Breeder):
         if not matching_females:
             matching_females = filtered_females
         
+        return filtered_males, filtered_females, matching_males, matching_females
+    
+    def select_pairs(
+        self,
+        eligible_males: List['Creature'],
+        eligible_females: List['Creature'],
+        num_pairs: int,
+        rng: np.random.Generator,
+        traits: List = None
+    ) -> List[Tuple['Creature', 'Creature']]:
+        """Select pairs based on target phenotypes. Mill breeders always avoid undesirable phenotypes."""
+        if not eligible_males or not eligible_females:
+            return []
+        
+        if traits is None:
+            traits = []
+        
+        _, _, matching_males, matching_females = self._candidate_pools(
+            eligible_males, eligible_females, traits
+        )
+        
         pairs = []
         for _ in range(num_pairs):
-            male = rng.choice(matching_males)
-            female = rng.choice(matching_females)
+            male = _pick(matching_males, rng)
+            female = _pick(matching_females, rng)
             pairs.append((male, female))
         
         return pairs
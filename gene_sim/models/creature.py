@@ -1,6 +1,7 @@
 """Creature model for gene_sim."""
 
-from typing import List, Optional, TYPE_CHECKING
+from functools import lru_cache
+from typing import List, Optional, Tuple, TYPE_CHECKING
 import numpy as np
 
 if TYPE_CHECKING:
@@ -8,15 +9,55 @@ if TYPE_CHECKING:
     from ..config import SimulationConfig
 
 
+# Genotype strings repeat heavily across a population; bound the parse caches anyway so
+# polygenic traits with many gene pairs cannot grow them without limit
+GENOTYPE_PARSE_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=GENOTYPE_PARSE_CACHE_SIZE)
+def _gamete_alleles(genotype_str: str) -> Tuple[bool, Tuple[Tuple[str, str], ...]]:
+    """
+    Split a non-sex-linked genotype into the allele pairs a gamete chooses from.
+    
+    Memoized so each distinct genotype string is parsed once per process rather than
+    on every gamete.
+    
+    Args:
+        genotype_str: Genotype string (e.g. "Bb", "AB", or "H1H1_H2h2")
+        
+    Returns:
+        Tuple of (is polygenic, (allele1, allele2) per gene pair). Simple genotypes
+        have a single pair; polygenic pairs shorter than two characters are skipped.
+    """
+    if '_' in genotype_str:
+        # Polygenic: each gene pair splits in half (e.g., "H1H1" -> ("H1", "H1"))
+        return True, tuple(
+            (pair[:len(pair) // 2], pair[len(pair) // 2:])
+            for pair in genotype_str.split('_')
+            if len(pair) >= 2
+        )
+    # Simple ("Bb" -> ("B", "b")) or longer codominant ("AB") genotypes split in half
+    mid = len(genotype_str) // 2
+    return False, ((genotype_str[:mid], genotype_str[mid:]),)
+
+
 class Creature:
     """Represents an individual creature with genome, lineage, and lifecycle attributes."""
     
+    # Creatures are created by the thousands every cycle; slots drop the per-instance dict
+    __slots__ = (
+        'simulation_id', 'birth_cycle', 'sex', 'genome', 'parent1_id', 'parent2_id',
+        'breeder_id', 'produced_by_breeder_id', 'inbreeding_coefficient', 'lifespan',
+        'is_alive', 'creature_id', 'conception_cycle', 'sexual_maturity_cycle',
+        'max_fertility_age_cycle', 'gestation_end_cycle', 'nursing_end_cycle', 'generation'
+    )
+    
     def __init__(
         self,
         simulation_id: int,
         birth_cycle: int,
         sex: Optional[str],
-        genome: List[Optional[str]],  # List indexed by trait_id, None for unset traits
+        genome: Tuple[Optional[str], ...],  # Indexed by trait_id, None for unset traits
         parent1_id: Optional[int] = None,
         parent2_id: Optional[int] = None,
         breeder_id: Optional[int] = None,
@@ -40,7 +81,8 @@ class Creature:
             simulation_id: ID of simulation this creature belongs to
             birth_cycle: Cycle when creature was born (0 for founders)
             sex: 'male', 'female', or None
-            genome: List of genotype strings indexed by trait_id (0-99)
+            genome: Tuple of genotype strings indexed by trait_id (0-99); genomes
+                never change after creation
             parent1_id: ID of first parent (None for founders)
             parent2_id: ID of second parent (None for founders)
             breeder_id: ID of breeder who owns this creature (None if unowned)
@@ -59,7 +101,7 @@ class Creature:
         self.simulation_id = simulation_id
         self.birth_cycle = birth_cycle
         self.sex = sex
-        self.genome = genome  # List[str] indexed by trait_id
+        self.genome = genome  # Tuple[str, ...] indexed by trait_id
         self.parent1_id = parent1_id
         self.parent2_id = parent2_id
         self.breeder_id = breeder_id
@@ -195,44 +237,22 @@ class Creature:
             raise ValueError(f"Creature has no genotype for trait {trait_id}")
         
         # Handle sex-linked traits differently
-        if trait.trait_type.value == 'SEX_LINKED':
+        if trait.is_sex_linked:
             if self.sex == 'male':
                 # Males have single allele (X chromosome)
                 return genotype_str  # Already single allele
             else:
                 # Females have two alleles, randomly select one
-                if len(genotype_str) == 2:
-                    return rng.choice(list(genotype_str))
-                else:
-                    # Handle multi-character genotypes (e.g., "Nc")
-                    alleles = list(genotype_str)
-                    return rng.choice(alleles)
+                # Index directly rather than rng.choice(list(...)), which builds an
+                # array per call; both draw the same bounded integer
+                return genotype_str[rng.integers(len(genotype_str))]
         else:
-            # Non-sex-linked: extract alleles from genotype string
-            # For simple genotypes like "BB", "Bb", extract individual alleles
-            # For polygenic like "H1H1_H2H2_H3H3", extract pairs
-            
-            if '_' in genotype_str:
-                # Polygenic: select one allele from each gene pair
-                gene_pairs = genotype_str.split('_')
-                selected = []
-                for pair in gene_pairs:
-                    if len(pair) >= 2:
-                        # Extract alleles (e.g., "H1H1" -> ["H1", "H1"])
-                        allele1 = pair[:len(pair)//2]
-                        allele2 = pair[len(pair)//2:]
-                        selected.append(rng.choice([allele1, allele2]))
-                return '_'.join(selected)
-            else:
-                # Simple genotype: extract two alleles
-                if len(genotype_str) == 2:
-                    return rng.choice(list(genotype_str))
-                else:
-                    # Handle longer genotypes (e.g., codominance "AB")
-                    mid = len(genotype_str) // 2
-                    allele1 = genotype_str[:mid]
-                    allele2 = genotype_str[mid:]
-                    return rng.choice([allele1, allele2])
+            # Non-sex-linked: pick one allele from each gene pair (a single pair for
+            # simple genotypes like "Bb"; one per pair for polygenic "H1H1_H2H2_H3H3")
+            polygenic, allele_pairs = _gamete_alleles(genotype_str)
+            if polygenic:
+                return '_'.join([pair[rng.integers(2)] for pair in allele_pairs])
+            return allele_pairs[0][rng.integers(2)]
     
     @staticmethod
     def calculate_relationship_coefficient(
@@ -256,32 +276,28 @@ class Creature:
         Returns:
             Coefficient of relationship (0.0 to 1.0)
         """
+        # Called for every candidate pair during breeder selection; read each
+        # lineage field once instead of re-chasing attributes in every check
+        a1, a2 = parent1.parent1_id, parent1.parent2_id
+        b1, b2 = parent2.parent1_id, parent2.parent2_id
+        
         # Check if siblings (share both parents)
-        if (parent1.parent1_id == parent2.parent1_id and 
-            parent1.parent2_id == parent2.parent2_id and
-            parent1.parent1_id is not None):
+        if a1 == b1 and a2 == b2 and a1 is not None:
             return 0.5
         
         # Check if parent-offspring relationship
-        if (parent1.creature_id == parent2.parent1_id or 
-            parent1.creature_id == parent2.parent2_id or
-            parent2.creature_id == parent1.parent1_id or
-            parent2.creature_id == parent1.parent2_id):
+        id1, id2 = parent1.creature_id, parent2.creature_id
+        if id1 == b1 or id1 == b2 or id2 == a1 or id2 == a2:
             return 0.5
         
         # Check if half-siblings (share one parent)
-        if (parent1.parent1_id == parent2.parent1_id and parent1.parent1_id is not None) or \
-           (parent1.parent1_id == parent2.parent2_id and parent1.parent1_id is not None) or \
-           (parent1.parent2_id == parent2.parent1_id and parent1.parent2_id is not None) or \
-           (parent1.parent2_id == parent2.parent2_id and parent1.parent2_id is not None):
+        if a1 is not None and (a1 == b1 or a1 == b2):
+            return 0.25
+        if a2 is not None and (a2 == b1 or a2 == b2):
             return 0.25
         
-        # Check if first cousins (simplified: check if grandparents match)
-        # This is a simplified check - full implementation would traverse pedigree
-        if (parent1.parent1_id is not None and parent2.parent1_id is not None):
-            # Would need to load parent objects to check their parents
-            # For Phase 1, we'll use a simplified approach
-            pass
+        # First cousins would need the grandparents, which are not reachable
+        # from parent IDs alone; Phase 1 treats them as unrelated
         
         # Default: unrelated
         return 0.0
@@ -304,6 +320,9 @@ class Creature:
             Inbreeding coefficient (0.0 to 1.0)
         """
         r_parents = Creature.calculate_relationship_coefficient(parent1, parent2)
+        if r_parents == 0.0:
+            # Unrelated parents (the common case): F is zero whatever the parents' own F
+            return 0.0
         f_parent1 = parent1.inbreeding_coefficient
         f_parent2 = parent2.inbreeding_coefficient
         
@@ -317,13 +336,16 @@ class Creature:
         cls,
         parent1: 'Creature',
         parent2: 'Creature',
+        *,
         conception_cycle: int,
         simulation_id: int,
         traits: List['Trait'],
         rng: np.random.Generator,
         config: 'SimulationConfig',
         breeder_id: Optional[int] = None,
-        produced_by_breeder_id: Optional[int] = None
+        produced_by_breeder_id: Optional[int] = None,
+        lifespan: int = 0,
+        genome_size: Optional[int] = None
     ) -> 'Creature':
         """
         Create an offspring from two parents.
@@ -338,13 +360,16 @@ class Creature:
             config: Simulation configuration
             breeder_id: Optional breeder ID (inherited from female parent if None)
             produced_by_breeder_id: ID of breeder whose breeding program produced this creature
+            lifespan: Lifespan in cycles (0 if it will be set later)
+            genome_size: Length of the genome list (max trait_id + 1); derived from
+                traits if None. Batch callers pass it to skip the per-child scan.
             
         Returns:
             New Creature instance
         """
         
         # Determine sex (50/50 for now, could be configurable)
-        sex = rng.choice(['male', 'female'])
+        sex = 'female' if rng.integers(2) else 'male'
         
         # Assign breeder_id (inherited from parents if not specified)
         # Offspring belong to the breeder who owns the female parent
@@ -352,16 +377,30 @@ class Creature:
             breeder_id = parent2.breeder_id if parent2.sex == 'female' else parent1.breeder_id
         
         # Create genome by combining gametes
-        max_trait_id = max(t.trait_id for t in traits) if traits else 0
-        genome: List[Optional[str]] = [None] * (max_trait_id + 1)
+        if genome_size is None:
+            genome_size = (max(t.trait_id for t in traits) if traits else 0) + 1
+        genome: List[Optional[str]] = [None] * genome_size
         
+        genome1 = parent1.genome
+        genome2 = parent2.genome
         for trait in traits:
+            trait_id = trait.trait_id
+            genotype1 = genome1[trait_id]
+            genotype2 = genome2[trait_id]
+            if genotype1 is not None and genotype2 is not None:
+                # Single-gene-pair autosomal crosses come from the trait's memoized
+                # table; one draw per parent, in the same order as produce_gamete
+                table = trait.cross(genotype1, genotype2)
+                if table is not None:
+                    genome[trait_id] = table[rng.integers(2)][rng.integers(2)]
+                    continue
+            
             # Get gametes from both parents
             gamete1 = parent1.produce_gamete(trait.trait_id, trait, rng)
             gamete2 = parent2.produce_gamete(trait.trait_id, trait, rng)
             
             # Combine gametes to form genotype
-            if trait.trait_type.value == 'SEX_LINKED':
+            if trait.is_sex_linked:
                 if sex == 'male':
                     # Male gets single allele (from mother's X chromosome)
                     genotype = gamete1 if parent1.sex == 'female' else gamete2
@@ -369,8 +408,7 @@ class Creature:
                     # Female gets two alleles
                     if len(gamete1) == 1 and len(gamete2) == 1:
                         # Sort alleles for consistency (e.g., "Nc" not "cN")
-                        alleles = sorted([gamete1, gamete2])
-                        genotype = ''.join(alleles)
+                        genotype = gamete1 + gamete2 if gamete1 <= gamete2 else gamete2 + gamete1
                     else:
                         # Handle multi-character alleles
                         genotype = f"{gamete1}{gamete2}"
@@ -380,32 +418,26 @@ class Creature:
                     # Polygenic: combine gene pairs
                     pairs1 = gamete1.split('_') if '_' in gamete1 else [gamete1]
                     pairs2 = gamete2.split('_') if '_' in gamete2 else [gamete2]
-                    combined = []
-                    for p1, p2 in zip(pairs1, pairs2):
-                        # Sort alleles within each pair for consistency
-                        combined.append(''.join(sorted([p1, p2])))
-                    genotype = '_'.join(combined)
+                    # Sort alleles within each pair for consistency
+                    genotype = '_'.join([
+                        p1 + p2 if p1 <= p2 else p2 + p1
+                        for p1, p2 in zip(pairs1, pairs2)
+                    ])
                 else:
-                    # Simple: combine and sort for consistency
-                    genotype = ''.join(sorted([gamete1, gamete2]))
+                    # Simple: combine and sort for consistency (concatenating in
+                    # order avoids building and sorting a two-element list per trait)
+                    genotype = gamete1 + gamete2 if gamete1 <= gamete2 else gamete2 + gamete1
             
-            genome[trait.trait_id] = genotype
+            genome[trait.trait_id] = trait.intern_genotype(genotype)
         
         # Calculate inbreeding coefficient
         inbreeding_coefficient = cls.calculate_inbreeding_coefficient(parent1, parent2)
         
         # Calculate cycle-based fields
         archetype = config.creature_archetype
-        gestation_cycles = archetype.gestation_cycles
-        maturity_cycles = archetype.maturity_cycles
-        
-        birth_cycle = conception_cycle + gestation_cycles
-        sexual_maturity_cycle = conception_cycle + gestation_cycles + maturity_cycles
-        
-        # Calculate max_fertility_age_cycle
-        max_fertility_age_years = archetype.max_fertility_age_years[sex]
-        cycles_per_year = 365.25 / archetype.menstrual_cycle_days
-        max_fertility_age_cycle = birth_cycle + int(max_fertility_age_years * cycles_per_year)
+        birth_cycle = conception_cycle + archetype.gestation_cycles
+        sexual_maturity_cycle = birth_cycle + archetype.maturity_cycles
+        max_fertility_age_cycle = birth_cycle + archetype.fertility_window_cycles[sex]
         
         # Calculate generation (lineage depth)
         parent1_gen = parent1.generation if parent1.generation is not None else 0
@@ -426,23 +458,26 @@ class Creature:
         parent1_id = parent1.creature_id
         parent2_id = parent2.creature_id
         
+        # Positional arguments in __init__ order: binding ~18 keywords costs about
+        # as much again as the construction itself, once per offspring
         return cls(
-            simulation_id=simulation_id,
-            birth_cycle=birth_cycle,
-            sex=sex,
-            genome=genome,
-            parent1_id=parent1_id,
-            parent2_id=parent2_id,
-            breeder_id=breeder_id,
-            produced_by_breeder_id=produced_by_breeder_id,
-            inbreeding_coefficient=inbreeding_coefficient,
-            lifespan=0,  # Will be set when added to population
-            is_alive=True,
-            conception_cycle=conception_cycle,
-            sexual_maturity_cycle=sexual_maturity_cycle,
-            max_fertility_age_cycle=max_fertility_age_cycle,
-            gestation_end_cycle=None,  # Not gestating yet (will be set when born)
-            nursing_end_cycle=None,  # Not nursing yet
-            generation=generation
+            simulation_id,
+            birth_cycle,
+            sex,
+            tuple(genome),  # Frozen: smaller than a list and hashable
+            parent1_id,
+            parent2_id,
+            breeder_id,
+            produced_by_breeder_id,
+            inbreeding_coefficient,
+            lifespan,
+            True,  # is_alive
+            None,  # creature_id (assigned when persisted)
+            conception_cycle,
+            sexual_maturity_cycle,
+            max_fertility_age_cycle,
+            None,  # gestation_end_cycle: not gestating yet (will be set when born)
+            None,  # nursing_end_cycle: not nursing yet
+            generation
         )
 
@@ -1,22 +1,159 @@
 """Cycle model for coordinating cycle-based simulation."""
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Optional, TYPE_CHECKING
+from functools import lru_cache
+from itertools import repeat
+from typing import Iterable, List, Dict, Optional, Tuple, TYPE_CHECKING
 import json
 import sqlite3
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+from .creature import Creature
+
 if TYPE_CHECKING:
     from .population import Population
     from .breeder import Breeder
-    from .creature import Creature
     from .trait import Trait
     from ..config import SimulationConfig
 
 
+SQL_INSERT_GENERATION_STATS = """
+    INSERT INTO generation_stats (
+        simulation_id, generation, population_size,
+        eligible_males, eligible_females, births, deaths
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+SQL_INSERT_OWNERSHIP_HISTORY = """
+    INSERT INTO creature_ownership_history (
+        creature_id, breeder_id, transfer_generation
+    ) VALUES (?, ?, ?)
+"""
+
+SQL_UPDATE_CREATURE_BREEDER = "UPDATE creatures SET breeder_id = ? WHERE creature_id = ?"
+
+# Multi-row inserts: the "(?, ...)" groups are appended by _insert_rows
+SQL_INSERT_GENOTYPE_FREQUENCY = """
+    INSERT INTO generation_genotype_frequencies (
+        simulation_id, generation, trait_id, genotype, frequency
+    ) VALUES """
+
+SQL_INSERT_TRAIT_STATS = """
+    INSERT INTO generation_trait_stats (
+        simulation_id, generation, trait_id,
+        allele_frequencies, heterozygosity, genotype_diversity
+    ) VALUES """
+
+# Offspring creation moves to worker processes (config.workers > 1) only for cycles
+# with at least this many pairs; below it, pickling parents costs more than it saves
+PARALLEL_OFFSPRING_MIN_PAIRS = 200
+# Pairs per worker task; fixed so results do not depend on the number of workers
+PARALLEL_OFFSPRING_CHUNK_PAIRS = 64
+
+# Stay well under SQLite's bound-parameter limit (999 on older builds) per statement
+SQL_MAX_PARAMS = 500
+
+
+@lru_cache(maxsize=None)
+def _multi_row_sql(insert_sql: str, columns: int, row_count: int) -> str:
+    """Build (once) the multi-row INSERT text for `row_count` rows of `columns` values."""
+    placeholder = '(' + ', '.join('?' * columns) + ')'
+    return insert_sql + ', '.join([placeholder] * row_count)
+
+
+def _insert_rows(cursor: sqlite3.Cursor, insert_sql: str, rows: Iterable[tuple], columns: int) -> None:
+    """
+    Insert rows using multi-row VALUES statements.
+    
+    Args:
+        cursor: Database cursor
+        insert_sql: INSERT statement ending in "VALUES "
+        rows: Row tuples, each with `columns` values
+        columns: Number of values per row
+    """
+    rows = list(rows)
+    rows_per_statement = max(1, SQL_MAX_PARAMS // columns)
+    for start in range(0, len(rows), rows_per_statement):
+        chunk = rows[start:start + rows_per_statement]
+        # Identical text for identical shapes, so sqlite3's statement cache
+        # hands back the already-prepared statement
+        cursor.execute(
+            _multi_row_sql(insert_sql, columns, len(chunk)),
+            [value for row in chunk for value in row]
+        )
+
+
+def _breed_batch(
+    pairs: List[Tuple['Creature', 'Creature', Optional[int]]],
+    litter_sizes: List[int],
+    lifespans: List[int],
+    traits: List['Trait'],
+    rng: np.random.Generator,
+    conception_cycle: int,
+    simulation_id: int,
+    config: 'SimulationConfig'
+) -> List['Creature']:
+    """
+    Create the litters for a batch of pairs.
+    
+    Module-level (and free of database access) so it can run in a worker process.
+    
+    Args:
+        pairs: (male, female, breeder_id) tuples
+        litter_sizes: Litter size for each pair
+        lifespans: Lifespan for each child, in output order
+        traits: List of all traits
+        rng: Random number generator
+        conception_cycle: Cycle when the offspring are conceived
+        simulation_id: Simulation ID
+        config: Simulation configuration
+        
+    Returns:
+        Offspring in pair order, litter by litter
+    """
+    children = []
+    lifespan_iter = iter(lifespans)
+    genome_size = (max(t.trait_id for t in traits) if traits else 0) + 1
+    for (male, female, breeder_id), litter_size in zip(pairs, litter_sizes):
+        for _ in range(litter_size):
+            children.append(Creature.create_offspring(
+                parent1=male,
+                parent2=female,
+                conception_cycle=conception_cycle,
+                simulation_id=simulation_id,
+                traits=traits,
+                rng=rng,
+                config=config,
+                produced_by_breeder_id=breeder_id,
+                lifespan=next(lifespan_iter),
+                genome_size=genome_size
+            ))
+    return children
+
+
+def _dumps_json(value: Dict[str, float]) -> str:
+    """Serialize a small dict to compact JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    # Same compact form orjson produces, so the stored text does not depend on it
+    return json.dumps(value, separators=(',', ':'))
+
+
 @dataclass
 class CycleStats:
-    """Statistics for a single cycle."""
+    """
+    Statistics for a single cycle.
+    
+    Per-trait scalar statistics are stored as arrays aligned with trait_ids;
+    genotype and allele frequencies stay keyed by trait_id because their
+    labels vary per trait.
+    """
     cycle: int
     population_size: int
     eligible_males: int
@@ -25,8 +162,9 @@ class CycleStats:
     deaths: int
     genotype_frequencies: Dict[int, Dict[str, float]]  # trait_id -> {genotype: frequency}
     allele_frequencies: Dict[int, Dict[str, float]]  # trait_id -> {allele: frequency}
-    heterozygosity: Dict[int, float]  # trait_id -> heterozygosity
-    genotype_diversity: Dict[int, int]  # trait_id -> diversity count
+    trait_ids: np.ndarray  # shape (T,), int64
+    heterozygosity: np.ndarray  # shape (T,), float64, aligned with trait_ids
+    genotype_diversity: np.ndarray  # shape (T,), int64 diversity counts, aligned with trait_ids
 
 
 class Cycle:
@@ -40,6 +178,16 @@ class Cycle:
             cycle_number: Cycle number (0 = initial state)
         """
         self.cycle_number = cycle_number
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._trait_ids_cache: Optional[Tuple[List['Trait'], np.ndarray]] = None
+        # Per-cycle working arrays, kept across cycles and grown when the population outgrows them
+        self._scratch: Dict[str, np.ndarray] = {}
+    
+    def close(self) -> None:
+        """Shut down the offspring worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
     
     def execute_cycle(
         self,
@@ -66,143 +214,124 @@ class Cycle:
         Returns:
             CycleStats object with calculated metrics
         """
-        from .creature import Creature
-        
+        # All of the cycle's writes share one transaction: committed when the cycle
+        # completes, rolled back if any step raises
+        with db_conn:
+            return self._execute_cycle(
+                population, breeders, traits, rng, db_conn, simulation_id, config
+            )
+    
+    def _execute_cycle(
+        self,
+        population: 'Population',
+        breeders: List['Breeder'],
+        traits: List['Trait'],
+        rng: np.random.Generator,
+        db_conn: sqlite3.Connection,
+        simulation_id: int,
+        config: 'SimulationConfig'
+    ) -> CycleStats:
+        """Run the steps of execute_cycle inside its transaction."""
         current_cycle = self.cycle_number
+        # One cursor for the cycle's transfer and statistics writes
+        cursor = db_conn.cursor()
         
         # 1. Handle births (creatures born when current_cycle == birth_cycle)
-        births_this_cycle = []
-        for creature in list(population.creatures):
-            if creature.birth_cycle == current_cycle and creature.birth_cycle > 0:
-                # Creature is born this cycle
-                births_this_cycle.append(creature)
-                # Set nursing_end_cycle for mother if this is a new birth
-                # (Note: We need to find the mother - this is handled when offspring are created)
+        # (Note: nursing_end_cycle for the mother is handled when offspring are created)
+        births_this_cycle = [
+            c for c in population.creatures
+            if c.birth_cycle == current_cycle and c.birth_cycle > 0
+        ]
         
         # 2. Filter eligible creatures for breeding
         # Check gestation, nursing, maturity, etc. (all creatures are fertile at the same time)
-        eligible_males = population.get_eligible_males(current_cycle, config)
-        eligible_females = population.get_eligible_females(current_cycle, config)
+        eligible_males, eligible_females = population.get_eligible_creatures(current_cycle, config)
         
         # 3. Distribute breeders and select pairs
-        # Track males that have mated this cycle (max 1 mate per cycle)
-        mated_males = set()
-        
         num_pairs = min(len(eligible_males), len(eligible_females))
         if num_pairs == 0:
             # No eligible pairs, skip reproduction
             offspring = []
+            offspring_pairs: List[Tuple[Creature, Creature, Optional[int]]] = []
         else:
-            # Filter out males that have already mated this cycle
-            available_males = [m for m in eligible_males if m.creature_id not in mated_males]
-            num_pairs = min(len(available_males), len(eligible_females))
-            
-            if num_pairs == 0:
-                offspring = []
-            else:
-                # Distribute pairs to breeders
-                all_pairs = []
-                if breeders and len(breeders) > 0:
-                    pairs_per_breeder = num_pairs // len(breeders)
-                    remaining_pairs = num_pairs % len(breeders)
-                    
-                    for i, breeder in enumerate(breeders):
-                        num_for_breeder = pairs_per_breeder + (1 if i < remaining_pairs else 0)
-                        if num_for_breeder > 0:
-                            # Pass traits to breeders that need them
-                            if hasattr(breeder, 'select_pairs'):
-                                # Check if breeder needs traits parameter
-                                import inspect
-                                sig = inspect.signature(breeder.select_pairs)
-                                if 'traits' in sig.parameters:
-                                    pairs = breeder.select_pairs(
-                                        available_males, eligible_females, num_for_breeder, rng, traits=traits
-                                    )
-                                else:
-                                    pairs = breeder.select_pairs(
-                                        available_males, eligible_females, num_for_breeder, rng
-                                    )
-                                # Tag each pair with the breeder that selected it
-                                for pair in pairs:
-                                    breeder_id = breeder.breeder_id if breeder.breeder_id is not None else None
-                                    all_pairs.append((pair[0], pair[1], breeder_id))
-                else:
-                    # No breeders: create random pairs without breeder assignment
-                    # This should not happen in normal operation, but handle gracefully
-                    import random
-                    shuffled_males = available_males.copy()
-                    shuffled_females = eligible_females.copy()
-                    rng.shuffle(shuffled_males)
-                    rng.shuffle(shuffled_females)
-                    for i in range(min(num_pairs, len(shuffled_males), len(shuffled_females))):
-                        all_pairs.append((shuffled_males[i], shuffled_females[i], None))
+            # Distribute pairs to breeders
+            all_pairs = []
+            if breeders and len(breeders) > 0:
+                pairs_per_breeder = num_pairs // len(breeders)
+                remaining_pairs = num_pairs % len(breeders)
                 
-                # 4. Create offspring at conception (current_cycle)
-                offspring = []
-                # Store parent references for later lookup when persisting removed offspring
-                parent_map = {}  # child -> (parent1, parent2)
+                # With fewer pairs than breeders only the first remaining_pairs breeders
+                # get a pair, so the rest are not visited at all
+                active_breeders = breeders if pairs_per_breeder > 0 else breeders[:remaining_pairs]
                 
-                for pair_data in all_pairs:
-                    if len(pair_data) == 3:
-                        male, female, breeder_id = pair_data
-                    else:
-                        # Backward compatibility: if no breeder_id, use None
-                        male, female = pair_data
-                        breeder_id = None
-                    # Mark male as mated this cycle
-                    if male.creature_id is not None:
-                        mated_males.add(male.creature_id)
-                    
-                    # Set gestation_end_cycle for female
-                    archetype = config.creature_archetype
-                    female.gestation_end_cycle = current_cycle + archetype.gestation_cycles
-                    
-                    # Determine litter size (number of offspring for this pair)
-                    litter_size = rng.integers(
-                        archetype.litter_size_min,
-                        archetype.litter_size_max + 1  # +1 because randint is exclusive on upper bound
-                    )
-                    
-                    # Create multiple offspring at conception (litter)
-                    for _ in range(litter_size):
-                        child = Creature.create_offspring(
-                            parent1=male,
-                            parent2=female,
-                            conception_cycle=current_cycle,
-                            simulation_id=simulation_id,
-                            traits=traits,
-                            rng=rng,
-                            config=config,
-                            produced_by_breeder_id=breeder_id
-                        )
-                        
-                        # Store parent references
-                        parent_map[child] = (male, female)
-                        
-                        # Update parent IDs from parent references
-                        # All parents should already have IDs since all creatures are persisted immediately
-                        if male.creature_id is None:
-                            raise ValueError(
-                                f"Parent1 (birth_cycle={male.birth_cycle}) does not have creature_id. "
-                                f"All creatures must be persisted immediately upon creation."
+                # Identically configured breeders share candidate pools built from this
+                # cycle's eligible lists; the cache lives only for this selection pass
+                pool_cache: dict = {}
+                for i, breeder in enumerate(active_breeders):
+                    num_for_breeder = pairs_per_breeder + (1 if i < remaining_pairs else 0)
+                    breeder._pool_cache = pool_cache
+                    try:
+                        # Pass traits to breeders that need them (resolved once at construction)
+                        if breeder._select_pairs_wants_traits:
+                            pairs = breeder.select_pairs(
+                                eligible_males, eligible_females, num_for_breeder, rng, traits=traits
                             )
-                        if female.creature_id is None:
-                            raise ValueError(
-                                f"Parent2 (birth_cycle={female.birth_cycle}) does not have creature_id. "
-                                f"All creatures must be persisted immediately upon creation."
+                        else:
+                            pairs = breeder.select_pairs(
+                                eligible_males, eligible_females, num_for_breeder, rng
                             )
-                        child.parent1_id = male.creature_id
-                        child.parent2_id = female.creature_id
-                        
-                        # Sample lifespan from config range (in cycles)
-                        lifespan = rng.integers(
-                            config.creature_archetype.lifespan_cycles_min,
-                            config.creature_archetype.lifespan_cycles_max + 1
-                        )
-                        child.lifespan = lifespan
-                        
-                        offspring.append(child)
-        
+                    finally:
+                        breeder._pool_cache = None
+                    # Tag each pair with the breeder that selected it
+                    breeder_id = breeder.breeder_id
+                    all_pairs.extend((male, female, breeder_id) for male, female in pairs)
+            else:
+                # No breeders: create random pairs without breeder assignment
+                # This should not happen in normal operation, but handle gracefully
+                shuffled_males = eligible_males.copy()
+                shuffled_females = eligible_females.copy()
+                rng.shuffle(shuffled_males)
+                rng.shuffle(shuffled_females)
+                for i in range(min(num_pairs, len(shuffled_males), len(shuffled_females))):
+                    all_pairs.append((shuffled_males[i], shuffled_females[i], None))
+            
+            # 4. Create offspring at conception (current_cycle)
+            # Sample litter sizes for every pair, then one lifespan per child (in cycles)
+            archetype = config.creature_archetype
+            litter_sizes = rng.integers(
+                archetype.litter_size_min,
+                archetype.litter_size_max + 1,  # +1 because randint is exclusive on upper bound
+                size=len(all_pairs)
+            )
+            lifespans = rng.integers(
+                archetype.lifespan_cycles_min,
+                archetype.lifespan_cycles_max + 1,
+                size=int(litter_sizes.sum())
+            ).tolist()
+            
+            litter_list = litter_sizes.tolist()
+            for _, female, _ in all_pairs:
+                # Set gestation_end_cycle for female
+                female.gestation_end_cycle = current_cycle + archetype.gestation_cycles
+            
+            # Create every litter at conception, in worker processes for large cycles when configured
+            if config.workers > 1 and len(all_pairs) >= PARALLEL_OFFSPRING_MIN_PAIRS:
+                offspring = self._breed_parallel(
+                    all_pairs, litter_list, lifespans, traits, rng, current_cycle, simulation_id, config
+                )
+            else:
+                offspring = _breed_batch(
+                    all_pairs, litter_list, lifespans, traits, rng, current_cycle, simulation_id, config
+                )
+            
+            # Children come back flat in pair order, fully initialized (parent IDs are
+            # set and validated by Creature.create_offspring)
+            # Parent references, kept parallel to offspring: offspring[i] was bred from the
+            # (male, female, breeder_id) pair offspring_pairs[i] (shared by the whole litter)
+            offspring_pairs = [
+                pair for pair, litter_size in zip(all_pairs, litter_list) for _ in range(litter_size)
+            ]
+    
         # 5. Handle births: Set nursing_end_cycle for mothers when offspring are born
         # Note: Offspring are created at conception, but born later (when birth_cycle == current_cycle)
         # For now, we'll handle births when they occur (in step 1), but we need to set nursing periods
@@ -221,75 +350,56 @@ class Cycle:
         # 6. Determine which offspring to keep vs give away based on ownership rules
         # Rule: Breeder gives away ALL offspring UNLESS parent is nearing end of reproduction
         # If parent is nearing end, breeder keeps ONE offspring as replacement
-        removed_offspring = []
-        remaining_offspring = []
+        keep = self._scratch_array('keep', len(offspring), bool)  # True = kept in the working pool
+        keep.fill(False)
         
         # Group offspring by breeder (owner)
-        offspring_by_breeder: Dict[Optional[int], List[Creature]] = {}
-        for child in offspring:
+        offspring_by_breeder: Dict[Optional[int], List[int]] = {}  # owner -> offspring indices
+        for i, child in enumerate(offspring):
             breeder_id = child.breeder_id
             if breeder_id not in offspring_by_breeder:
                 offspring_by_breeder[breeder_id] = []
-            offspring_by_breeder[breeder_id].append(child)
+            offspring_by_breeder[breeder_id].append(i)
+        
+        # Evaluate each parent once per cycle; siblings share the same parents
+        nearing_end: Dict[int, bool] = {}  # parent creature_id -> nearing end of reproduction
+        
+        def is_nearing_end(parent: Creature) -> bool:
+            result = nearing_end.get(parent.creature_id)
+            if result is None:
+                result = parent.is_nearing_end_of_reproduction(current_cycle, config)
+                nearing_end[parent.creature_id] = result
+            return result
         
         # Process each breeder's offspring
-        for breeder_id, breeder_offspring in offspring_by_breeder.items():
+        for breeder_id, breeder_indices in offspring_by_breeder.items():
             # Check if any parent is nearing end of reproduction
             parent_nearing_end = False
-            for child in breeder_offspring:
-                if child in parent_map:
-                    parent1, parent2 = parent_map[child]
-                    # Check if either parent is nearing end (and owned by this breeder)
-                    if (parent1.breeder_id == breeder_id and 
-                        parent1.is_nearing_end_of_reproduction(current_cycle, config)):
-                        parent_nearing_end = True
-                        break
-                    if (parent2.breeder_id == breeder_id and 
-                        parent2.is_nearing_end_of_reproduction(current_cycle, config)):
-                        parent_nearing_end = True
-                        break
+            for i in breeder_indices:
+                parent1, parent2, _ = offspring_pairs[i]
+                # Check if either parent is nearing end (and owned by this breeder)
+                if parent1.breeder_id == breeder_id and is_nearing_end(parent1):
+                    parent_nearing_end = True
+                    break
+                if parent2.breeder_id == breeder_id and is_nearing_end(parent2):
+                    parent_nearing_end = True
+                    break
             
             if parent_nearing_end:
-                # Keep ONE offspring as replacement, give away the rest
-                if len(breeder_offspring) > 0:
-                    # Keep first one, remove the rest
-                    remaining_offspring.append(breeder_offspring[0])
-                    removed_offspring.extend(breeder_offspring[1:])
-            else:
-                # Give away ALL offspring
-                removed_offspring.extend(breeder_offspring)
-        
-        # Update parent IDs for all offspring before persisting
-        all_offspring = removed_offspring + remaining_offspring
-        for child in all_offspring:
-            if child.birth_cycle > 0 and child in parent_map:
-                parent1, parent2 = parent_map[child]
-                if child.parent1_id is None:
-                    if parent1.creature_id is None:
-                        raise ValueError(
-                            f"Parent1 (birth_cycle={parent1.birth_cycle}) does not have creature_id. "
-                            f"All creatures must be persisted immediately upon creation."
-                        )
-                    child.parent1_id = parent1.creature_id
-                if child.parent2_id is None:
-                    if parent2.creature_id is None:
-                        raise ValueError(
-                            f"Parent2 (birth_cycle={parent2.birth_cycle}) does not have creature_id. "
-                            f"All creatures must be persisted immediately upon creation."
-                        )
-                    child.parent2_id = parent2.creature_id
-        
-        # Persist removed offspring immediately (all creatures are persisted upon creation)
-        if removed_offspring:
-            population._persist_creatures(db_conn, simulation_id, removed_offspring)
-        
-        # 7. Persist remaining offspring immediately upon creation
-        # All creatures are persisted immediately to ensure they have IDs from the start
+                # Keep the first offspring as replacement, give away the rest
+                keep[breeder_indices[0]] = True
+            # Otherwise give away ALL offspring (nothing to mark)
+        
+        remaining_offspring = [offspring[i] for i in np.flatnonzero(keep).tolist()]
+        all_offspring = offspring
+        
+        # 7. Persist all offspring immediately upon creation in a single batch
+        # All creatures are persisted immediately to ensure they have IDs from the start;
+        # the removed/remaining split only affects the in-memory working pool
+        if all_offspring:
+            population._persist_creatures(db_conn, simulation_id, all_offspring)
+        
         if remaining_offspring:
-            # Parent IDs already updated in step 6
-            # Persist remaining offspring immediately (all creatures are persisted upon creation)
-            population._persist_creatures(db_conn, simulation_id, remaining_offspring)
-            
             # Note: Offspring are created at conception but not added to population until birth
             # They will be added when birth_cycle == current_cycle (handled in step 1)
             # For now, we'll add them immediately for simplicity (they'll be in population but not eligible until birth)
@@ -304,24 +414,19 @@ class Cycle:
         # Most creatures have 2-3 owners throughout their lives
         # Simulate ownership transfers as random events
         self._handle_ownership_transfers(
-            population, breeders, db_conn, simulation_id, rng
+            population, breeders, cursor, simulation_id, rng
         )
         
         # 9. Get aged-out creatures (before removal)
         aged_out = population.get_aged_out_creatures()
         
-        # 10. Calculate statistics (before removal)
-        genotype_frequencies = {}
-        allele_frequencies = {}
-        heterozygosity = {}
-        genotype_diversity = {}
-        
-        for trait in traits:
-            trait_id = trait.trait_id
-            genotype_frequencies[trait_id] = population.calculate_genotype_frequencies(trait_id)
-            allele_frequencies[trait_id] = population.calculate_allele_frequencies(trait_id, trait)
-            heterozygosity[trait_id] = population.calculate_heterozygosity(trait_id)
-            genotype_diversity[trait_id] = population.calculate_genotype_diversity(trait_id)
+        # 10. Calculate statistics (before removal) in one pass over the population
+        (
+            genotype_frequencies,
+            allele_frequencies,
+            heterozygosity,
+            genotype_diversity
+        ) = population.calculate_trait_statistics(traits)
         
         stats = CycleStats(
             cycle=current_cycle,
@@ -332,23 +437,121 @@ class Cycle:
             deaths=len(aged_out),
             genotype_frequencies=genotype_frequencies,
             allele_frequencies=allele_frequencies,
+            trait_ids=self._trait_ids(traits),
             heterozygosity=heterozygosity,
             genotype_diversity=genotype_diversity
         )
         
         # 11. Persist cycle statistics
-        self._persist_cycle_stats(db_conn, simulation_id, stats, traits)
+        self._persist_cycle_stats(cursor, simulation_id, stats, traits)
         
         # 12. Remove aged-out creatures (they are already persisted)
         population.remove_aged_out_creatures(db_conn, simulation_id)
         
         return stats
     
+    def _trait_ids(self, traits: List['Trait']) -> np.ndarray:
+        """
+        Return the trait IDs as a read-only int64 array, rebuilt only when traits changes.
+        
+        Args:
+            traits: List of all traits
+            
+        Returns:
+            Array of trait IDs in traits order, shared between cycles
+        """
+        cached = self._trait_ids_cache
+        if cached is None or cached[0] is not traits or len(cached[1]) != len(traits):
+            trait_ids = np.array([t.trait_id for t in traits], dtype=np.int64)
+            trait_ids.flags.writeable = False
+            self._trait_ids_cache = (traits, trait_ids)
+        return self._trait_ids_cache[1]
+    
+    def _scratch_array(self, name: str, size: int, dtype) -> np.ndarray:
+        """
+        Return a length-size view of a working array reused across cycles.
+        
+        The backing array is reallocated (with headroom) only when size exceeds its
+        capacity, so steady-state cycles allocate no new memory for it. Contents are
+        left over from the previous cycle; callers overwrite or clear the view.
+        
+        Args:
+            name: Buffer name
+            size: Number of elements needed this cycle
+            dtype: NumPy dtype of the buffer
+            
+        Returns:
+            View of the first size elements of the buffer
+        """
+        buffer = self._scratch.get(name)
+        if buffer is None or len(buffer) < size:
+            capacity = size if buffer is None else max(size, 2 * len(buffer))
+            buffer = np.empty(capacity, dtype=dtype)
+            self._scratch[name] = buffer
+        return buffer[:size]
+    
+    def _breed_parallel(
+        self,
+        pairs: List[Tuple['Creature', 'Creature', Optional[int]]],
+        litter_sizes: List[int],
+        lifespans: List[int],
+        traits: List['Trait'],
+        rng: np.random.Generator,
+        conception_cycle: int,
+        simulation_id: int,
+        config: 'SimulationConfig'
+    ) -> List['Creature']:
+        """
+        Create offspring for all pairs across a pool of worker processes.
+        
+        Pairs are split into fixed-size chunks, each bred with its own generator
+        spawned from rng, so results depend on the seed but not on the number of
+        workers.
+        
+        Args:
+            pairs: (male, female, breeder_id) tuples
+            litter_sizes: Litter size for each pair
+            lifespans: Lifespan for each child, in output order
+            traits: List of all traits
+            rng: Random number generator (chunk generators are spawned from it)
+            conception_cycle: Current cycle
+            simulation_id: Simulation ID
+            config: Simulation configuration
+            
+        Returns:
+            Offspring in pair order, litter by litter
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=config.workers)
+        
+        starts = range(0, len(pairs), PARALLEL_OFFSPRING_CHUNK_PAIRS)
+        chunk_rngs = rng.spawn(len(starts))
+        # Each chunk takes the lifespans of its own children
+        litter_chunks = [litter_sizes[start:start + PARALLEL_OFFSPRING_CHUNK_PAIRS] for start in starts]
+        lifespan_chunks = []
+        lifespan_start = 0
+        for litters in litter_chunks:
+            lifespan_end = lifespan_start + sum(litters)
+            lifespan_chunks.append(lifespans[lifespan_start:lifespan_end])
+            lifespan_start = lifespan_end
+        batches = self._executor.map(
+            _breed_batch,
+            [pairs[start:start + PARALLEL_OFFSPRING_CHUNK_PAIRS] for start in starts],
+            litter_chunks,
+            lifespan_chunks,
+            repeat(traits),
+            chunk_rngs,
+            repeat(conception_cycle),
+            repeat(simulation_id),
+            repeat(config)
+        )
+        return [child for batch in batches for child in batch]
+    
     def _handle_ownership_transfers(
         self,
         population: 'Population',
         breeders: List['Breeder'],
-        db_conn: sqlite3.Connection,
+        cursor: sqlite3.Cursor,
         simulation_id: int,
         rng: np.random.Generator
     ) -> None:
@@ -361,15 +564,13 @@ class Cycle:
         Args:
             population: Current population
             breeders: List of all breeders
-            db_conn: Database connection
+            cursor: Database cursor (the caller commits)
             simulation_id: Simulation ID
             rng: Random number generator
         """
         if not breeders:
             return
         
-        cursor = db_conn.cursor()
-        
         # Calculate transfer probability
         # If creatures live ~15 generations and have 2-3 owners on average,
         # that's about 1-2 transfers per creature lifetime
@@ -377,54 +578,68 @@ class Cycle:
         # Use 0.12 as middle ground (about 1.8 transfers per 15-generation lifetime)
         transfer_probability = 0.12
         
-        for creature in population.creatures:
-            if creature.breeder_id is None:
-                continue
-            
-            # Random chance of ownership transfer
-            if rng.random() < transfer_probability:
-                # Select new owner (random, excluding current owner)
-                available_breeders = [b for b in breeders if b.breeder_id != creature.breeder_id]
-                if available_breeders:
-                    new_owner = rng.choice(available_breeders)
-                    old_breeder_id = creature.breeder_id
-                    creature.breeder_id = new_owner.breeder_id
-                    
-                    # Record ownership transfer in database
-                    cursor.execute("""
-                        INSERT INTO creature_ownership_history (
-                            creature_id, breeder_id, transfer_generation
-                        ) VALUES (?, ?, ?)
-                    """, (creature.creature_id, new_owner.breeder_id, self.cycle_number))
-                    
-                    # Update creature's breeder_id in database
-                    cursor.execute("""
-                        UPDATE creatures
-                        SET breeder_id = ?
-                        WHERE creature_id = ?
-                    """, (new_owner.breeder_id, creature.creature_id))
-        
-        db_conn.commit()
+        creatures = population.creatures
+        if not creatures:
+            return
+        
+        # Draw every transfer decision in one vectorized pass
+        breeder_index = {b.breeder_id: i for i, b in enumerate(breeders)}
+        owner_index = np.fromiter(
+            (breeder_index.get(c.breeder_id, -1) for c in creatures),
+            dtype=np.int64,
+            count=len(creatures)
+        )
+        owned = np.fromiter(
+            (c.breeder_id is not None for c in creatures),
+            dtype=bool,
+            count=len(creatures)
+        )
+        draws = rng.random(out=self._scratch_array('transfer_draws', len(creatures), np.float64))
+        transfer_mask = (draws < transfer_probability) & owned
+        
+        # Creatures whose current owner is a known breeder choose among the other
+        # B-1 breeders; shifting picks at or above the owner's index skips the owner
+        idx = np.flatnonzero(transfer_mask)
+        current = owner_index[idx]
+        has_owner = current >= 0
+        choices = len(breeders) - has_owner.astype(np.int64)
+        can_transfer = choices > 0
+        idx = idx[can_transfer]
+        current = current[can_transfer]
+        has_owner = has_owner[can_transfer]
+        picks = rng.integers(0, choices[can_transfer])
+        picks += has_owner & (picks >= current)
+        
+        history_rows = []
+        owner_rows = []
+        for creature_idx, pick in zip(idx.tolist(), picks.tolist()):
+            creature = creatures[creature_idx]
+            new_breeder_id = breeders[pick].breeder_id
+            creature.breeder_id = new_breeder_id
+            history_rows.append((creature.creature_id, new_breeder_id, self.cycle_number))
+            owner_rows.append((new_breeder_id, creature.creature_id))
+        
+        if history_rows:
+            # Record ownership transfers in database
+            cursor.executemany(SQL_INSERT_OWNERSHIP_HISTORY, history_rows)
+            # Fixed-shape primary-key updates reuse one prepared statement, where
+            # IN (...) lists of varying length each compiled a new one
+            cursor.executemany(SQL_UPDATE_CREATURE_BREEDER, owner_rows)
     
     def _persist_cycle_stats(
         self,
-        db_conn: sqlite3.Connection,
+        cursor: sqlite3.Cursor,
         simulation_id: int,
         stats: CycleStats,
         traits: List['Trait']
     ) -> None:
-        """Persist cycle statistics to database."""
-        cursor = db_conn.cursor()
+        """Persist cycle statistics to database (the caller commits)."""
+        cycle = stats.cycle  # Stored in the generation column
         
         # Insert generation_stats (using generation column to store cycle number)
-        cursor.execute("""
-            INSERT INTO generation_stats (
-                simulation_id, generation, population_size,
-                eligible_males, eligible_females, births, deaths
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
+        cursor.execute(SQL_INSERT_GENERATION_STATS, (
             simulation_id,
-            stats.cycle,  # Store cycle number in generation column
+            cycle,
             stats.population_size,
             stats.eligible_males,
             stats.eligible_females,
@@ -433,46 +648,28 @@ class Cycle:
         ))
         
         # Batch insert genotype frequencies
-        genotype_freq_data = []
-        for trait_id, frequencies in stats.genotype_frequencies.items():
-            for genotype, frequency in frequencies.items():
-                genotype_freq_data.append((
-                    simulation_id,
-                    stats.cycle,  # Store cycle number in generation column
-                    trait_id,
-                    genotype,
-                    frequency
-                ))
-        
-        if genotype_freq_data:
-            cursor.executemany("""
-                INSERT INTO generation_genotype_frequencies (
-                    simulation_id, generation, trait_id, genotype, frequency
-                ) VALUES (?, ?, ?, ?, ?)
-            """, genotype_freq_data)
+        _insert_rows(cursor, SQL_INSERT_GENOTYPE_FREQUENCY, (
+            (simulation_id, cycle, trait_id, genotype, frequency)
+            for trait_id, frequencies in stats.genotype_frequencies.items()
+            for genotype, frequency in frequencies.items()
+        ), columns=5)
         
         # Batch insert trait stats
-        trait_stats_data = []
-        for trait_id in [t.trait_id for t in traits]:
-            allele_freqs = stats.allele_frequencies.get(trait_id, {})
-            trait_stats_data.append((
+        _insert_rows(cursor, SQL_INSERT_TRAIT_STATS, (
+            (
                 simulation_id,
-                stats.cycle,  # Store cycle number in generation column
+                cycle,
                 trait_id,
-                json.dumps(allele_freqs),
-                stats.heterozygosity.get(trait_id, 0.0),
-                stats.genotype_diversity.get(trait_id, 0)
-            ))
-        
-        if trait_stats_data:
-            cursor.executemany("""
-                INSERT INTO generation_trait_stats (
-                    simulation_id, generation, trait_id,
-                    allele_frequencies, heterozygosity, genotype_diversity
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """, trait_stats_data)
-        
-        db_conn.commit()
+                _dumps_json(stats.allele_frequencies.get(trait_id, {})),
+                heterozygosity,
+                genotype_diversity
+            )
+            for trait_id, heterozygosity, genotype_diversity in zip(
+                stats.trait_ids.tolist(),
+                stats.heterozygosity.tolist(),
+                stats.genotype_diversity.tolist()
+            )
+        ), columns=6)
     
     def advance(self) -> int:
         """
@@ -1,20 +1,195 @@
 """Population model for managing working pool of creatures."""
 
-from typing import List, Dict, Optional, TYPE_CHECKING
-from .creature import Creature
+from collections import Counter, defaultdict, deque
+from functools import lru_cache
+from typing import Deque, List, Dict, Optional, Tuple, TYPE_CHECKING
+import numpy as np
+
+from .creature import Creature, GENOTYPE_PARSE_CACHE_SIZE
 
 if TYPE_CHECKING:
+    from .trait import Trait
     from ..config import SimulationConfig
 
 
+SQL_INSERT_CREATURE = """
+    INSERT INTO creatures (
+        simulation_id, birth_cycle, sex, parent1_id, parent2_id, breeder_id,
+        produced_by_breeder_id, inbreeding_coefficient, lifespan, is_alive,
+        conception_cycle, sexual_maturity_cycle, max_fertility_age_cycle,
+        gestation_end_cycle, nursing_end_cycle, generation
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SQL_INSERT_CREATURE_GENOTYPE = """
+    INSERT INTO creature_genotypes (creature_id, trait_id, genotype)
+    VALUES (?, ?, ?)
+"""
+
+
+@lru_cache(maxsize=GENOTYPE_PARSE_CACHE_SIZE)
+def _split_alleles(genotype_str: str, sex_linked: bool, sex: Optional[str]) -> Tuple[Tuple[str, ...], int]:
+    """
+    Split a genotype string into the alleles it contributes to allele frequencies.
+    
+    Memoized: a simulation only ever sees a handful of distinct genotype strings.
+    
+    Args:
+        genotype_str: Genotype string (e.g. "Bb", "H1H1_H2h2", or "X" for a sex-linked male)
+        sex_linked: Whether the trait is SEX_LINKED
+        sex: Sex of the creature carrying the genotype
+        
+    Returns:
+        Tuple of (alleles to count, amount added to the allele total)
+    """
+    if sex_linked:
+        if sex == 'male':
+            # Male has single allele
+            return (genotype_str,), 1
+        if len(genotype_str) == 2:
+            # Female has two alleles
+            return tuple(genotype_str), 2
+        # Handle multi-character alleles (e.g., "Nc")
+        # Simplified: treat as single allele for now
+        return (genotype_str,), 1
+    
+    if '_' in genotype_str:
+        # Polygenic: extract from each gene pair
+        alleles = []
+        for pair in genotype_str.split('_'):
+            if len(pair) >= 2:
+                mid = len(pair) // 2
+                alleles.append(pair[:mid])
+                alleles.append(pair[mid:])
+        return tuple(alleles), len(alleles)
+    
+    if len(genotype_str) == 2:
+        # Simple: extract two alleles
+        return tuple(genotype_str), 2
+    
+    # Handle longer genotypes
+    mid = len(genotype_str) // 2
+    return (genotype_str[:mid], genotype_str[mid:]), 1
+
+
+@lru_cache(maxsize=GENOTYPE_PARSE_CACHE_SIZE)
+def _is_heterozygous(genotype_str: str) -> bool:
+    """
+    Check whether a genotype string is heterozygous.
+    
+    Simple two-character genotypes (the common case) are decided with a single
+    character comparison; only longer and polygenic strings are sliced.
+    
+    Args:
+        genotype_str: Genotype string (e.g. "Bb" or "H1H1_H2h2")
+        
+    Returns:
+        True if the alleles differ (for polygenic, if any gene pair differs)
+    """
+    if '_' not in genotype_str:
+        if len(genotype_str) == 2:
+            return genotype_str[0] != genotype_str[1]
+        # Multi-character: check if halves differ
+        mid = len(genotype_str) // 2
+        return genotype_str[:mid] != genotype_str[mid:]
+    
+    # Polygenic: check if any gene pair is heterozygous
+    for pair in genotype_str.split('_'):
+        if len(pair) >= 2:
+            mid = len(pair) // 2
+            if pair[:mid] != pair[mid:]:
+                return True
+    return False
+
+
 class Population:
     """Manages the working pool of creatures and aging-out list."""
     
     def __init__(self):
         """Initialize empty population."""
         self.creatures: List[Creature] = []
-        # Aging-out list: List[List[Creature]] where index 0 = current cycle
-        self.age_out: List[List[Creature]] = []
+        # Aging-out list: one slot per cycle where index 0 = current cycle; a deque so
+        # dropping the current slot each cycle is O(1) instead of copying the list
+        self.age_out: Deque[List[Creature]] = deque()
+        # Bumped whenever the working pool changes; keys the trait statistics cache
+        self._version = 0
+        self._trait_stats_cache: Optional[Tuple[tuple, tuple]] = None
+        # Per-trait genotype counts with both sexes combined, keyed like the trait
+        # statistics cache so repeated per-trait queries skip the merge
+        self._combined_counts_cache: Dict[int, Tuple[tuple, Counter]] = {}
+        # Working pool split by sex (same relative order as creatures), maintained by
+        # add_creatures/remove_aged_out_creatures so eligibility only scans one sex
+        self._males: List[Creature] = []
+        self._females: List[Creature] = []
+        # Running genotype counts per trait, keyed by (genotype, sex) since sex-linked
+        # allele counting depends on sex; maintained alongside the sex lists
+        self._genotype_counts: Dict[int, Counter] = defaultdict(Counter)
+        self._sex_index_source: Optional[List[Creature]] = None
+    
+    def _sync_indexes(self) -> None:
+        """
+        Rebuild the sex lists and genotype counts if they no longer match creatures.
+        
+        They are maintained incrementally by add_creatures/remove_aged_out_creatures;
+        a rebuild only happens if creatures was replaced or resized directly.
+        """
+        if (
+            self._sex_index_source is not self.creatures
+            or len(self._males) + len(self._females) != len(self.creatures)
+        ):
+            self._males = [c for c in self.creatures if c.sex == 'male']
+            self._females = [c for c in self.creatures if c.sex == 'female']
+            self._genotype_counts = defaultdict(Counter)
+            self._count_genotypes(self.creatures, 1)
+            self._sex_index_source = self.creatures
+            self._version += 1
+    
+    def _sex_index(self) -> Tuple[List[Creature], List[Creature]]:
+        """
+        Return the working pool split into (males, females).
+        
+        Returns:
+            Tuple of (males, females) lists
+        """
+        self._sync_indexes()
+        return self._males, self._females
+    
+    def _genotype_index(self) -> Dict[int, Counter]:
+        """
+        Return the running genotype counts of the working pool.
+        
+        Returns:
+            Dictionary mapping trait_id to a Counter of (genotype, sex) -> creatures
+        """
+        self._sync_indexes()
+        return self._genotype_counts
+    
+    def _count_genotypes(self, creatures: List[Creature], delta: int) -> None:
+        """
+        Add (delta=1) or remove (delta=-1) creatures from the running genotype counts.
+        
+        Args:
+            creatures: Creatures entering or leaving the working pool
+            delta: +1 or -1
+        """
+        # Tally the batch first (Counter counts an iterable in C), then apply one
+        # update per distinct (trait_id, genotype, sex) instead of one per creature
+        batch = Counter(
+            (trait_id, genotype, creature.sex)
+            for creature in creatures
+            for trait_id, genotype in enumerate(creature.genome)
+            if genotype is not None
+        )
+        counts = self._genotype_counts
+        for (trait_id, genotype, sex), n in batch.items():
+            trait_counts = counts[trait_id]
+            key = (genotype, sex)
+            total = trait_counts[key] + delta * n
+            if total > 0:
+                trait_counts[key] = total
+            else:
+                # Drop emptied entries so distinct-genotype counts stay exact
+                del trait_counts[key]
     
     def get_eligible_males(
         self, 
@@ -31,10 +206,8 @@ class Population:
         Returns:
             List of eligible male creatures
         """
-        return [
-            c for c in self.creatures
-            if c.sex == 'male' and c.is_breeding_eligible(current_cycle, config)
-        ]
+        males, _ = self._sex_index()
+        return [c for c in males if c.is_breeding_eligible(current_cycle, config)]
     
     def get_eligible_females(
         self, 
@@ -51,10 +224,29 @@ class Population:
         Returns:
             List of eligible female creatures
         """
-        return [
-            c for c in self.creatures
-            if c.sex == 'female' and c.is_breeding_eligible(current_cycle, config)
-        ]
+        _, females = self._sex_index()
+        return [c for c in females if c.is_breeding_eligible(current_cycle, config)]
+    
+    def get_eligible_creatures(
+        self,
+        current_cycle: int,
+        config: 'SimulationConfig'
+    ) -> Tuple[List[Creature], List[Creature]]:
+        """
+        Get eligible males and females for breeding in one call.
+        
+        Args:
+            current_cycle: Current simulation cycle
+            config: Simulation configuration
+            
+        Returns:
+            Tuple of (eligible males, eligible females)
+        """
+        males, females = self._sex_index()
+        return (
+            [c for c in males if c.is_breeding_eligible(current_cycle, config)],
+            [c for c in females if c.is_breeding_eligible(current_cycle, config)]
+        )
     
     def add_creatures(self, creatures: List[Creature], current_cycle: int) -> None:
         """
@@ -64,20 +256,38 @@ class Population:
             creatures: List of creatures to add
             current_cycle: Current simulation cycle
         """
+        males, females = self._sex_index()
         self.creatures.extend(creatures)
+        if creatures:
+            self._version += 1
+            for creature in creatures:
+                if creature.sex == 'male':
+                    males.append(creature)
+                elif creature.sex == 'female':
+                    females.append(creature)
+            self._count_genotypes(creatures, 1)
         
-        # Update aging-out list
-        for creature in creatures:
-            # Calculate relative cycle when creature will age out
-            # Age out when: current_cycle >= birth_cycle + lifespan
-            relative_cycle = creature.birth_cycle + creature.lifespan - current_cycle
-            
-            # Ensure aging-out list is large enough
-            while len(self.age_out) <= relative_cycle:
-                self.age_out.append([])
-            
-            # Append creature to appropriate cycle slot
-            self.age_out[relative_cycle].append(creature)
+        if not creatures:
+            return
+        
+        # Update aging-out list: one bucket per cycle, so aging reads a single slot
+        # instead of scanning the pool for creatures whose lifespan has ended
+        # Age out when: current_cycle >= birth_cycle + lifespan; a lifespan that has
+        # already elapsed ages out at the next removal (slot 0), never wrapping to
+        # the end of the list as a negative index would
+        relative_cycles = [
+            max(creature.birth_cycle + creature.lifespan - current_cycle, 0)
+            for creature in creatures
+        ]
+        
+        # Grow the aging-out list once for the whole batch
+        age_out = self.age_out
+        missing = max(relative_cycles) + 1 - len(age_out)
+        if missing > 0:
+            age_out.extend([] for _ in range(missing))
+        
+        for creature, relative_cycle in zip(creatures, relative_cycles):
+            age_out[relative_cycle].append(creature)
     
     def get_aged_out_creatures(self) -> List[Creature]:
         """
@@ -108,19 +318,53 @@ class Population:
         # All creatures are already persisted immediately upon creation,
         # so we only need to remove them from the working pool
         creature_ids_to_remove = {c.creature_id for c in aged_out if c.creature_id is not None}
-        self.creatures = [c for c in self.creatures if c.creature_id not in creature_ids_to_remove]
-        
-        # Slice off age_out[0]
+        if creature_ids_to_remove:
+            males, females = self._sex_index()
+            self._count_genotypes(
+                [c for c in self.creatures if c.creature_id in creature_ids_to_remove], -1
+            )
+            self.creatures = [c for c in self.creatures if c.creature_id not in creature_ids_to_remove]
+            self._version += 1
+            self._males = [c for c in males if c.creature_id not in creature_ids_to_remove]
+            self._females = [c for c in females if c.creature_id not in creature_ids_to_remove]
+            self._sex_index_source = self.creatures
+        
+        # Drop age_out[0] (del works in place for the deque and for plain lists)
         if len(self.age_out) > 0:
-            self.age_out = self.age_out[1:]
+            del self.age_out[0]
     
     def advance_cycle(self) -> None:
         """
-        Advance aging-out list by slicing off the first element.
+        Advance aging-out list by dropping the first element.
         Should be called after remove_aged_out_creatures.
         """
         if len(self.age_out) > 0:
-            self.age_out = self.age_out[1:]
+            del self.age_out[0]
+    
+    def _trait_genotype_counts(self, trait_id: int) -> Counter:
+        """
+        Get genotype counts for a trait from the running counts (both sexes combined).
+        
+        The merged counts are cached until the working pool changes; the returned
+        Counter is shared between calls and must not be mutated.
+        
+        Args:
+            trait_id: ID of the trait
+            
+        Returns:
+            Counter mapping genotype strings to number of creatures
+        """
+        index = self._genotype_index()
+        cache_key = (self._version, id(self.creatures), len(self.creatures))
+        cached = self._combined_counts_cache.get(trait_id)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+        
+        genotype_counts: Counter = Counter()
+        for (genotype, _), count in index.get(trait_id, {}).items():
+            genotype_counts[genotype] += count
+        self._combined_counts_cache[trait_id] = (cache_key, genotype_counts)
+        return genotype_counts
     
     def calculate_genotype_frequencies(self, trait_id: int) -> Dict[str, float]:
         """
@@ -135,14 +379,8 @@ class Population:
         if not self.creatures:
             return {}
         
-        genotype_counts: Dict[str, int] = {}
-        total = 0
-        
-        for creature in self.creatures:
-            if trait_id < len(creature.genome) and creature.genome[trait_id] is not None:
-                genotype = creature.genome[trait_id]
-                genotype_counts[genotype] = genotype_counts.get(genotype, 0) + 1
-                total += 1
+        genotype_counts = self._trait_genotype_counts(trait_id)
+        total = sum(genotype_counts.values())
         
         if total == 0:
             return {}
@@ -163,60 +401,16 @@ class Population:
         if not self.creatures:
             return {}
         
-        allele_counts: Dict[str, int] = {}
+        allele_counts: Dict[str, int] = defaultdict(int)
         total_alleles = 0
+        sex_linked = trait.is_sex_linked
         
-        for creature in self.creatures:
-            if trait_id >= len(creature.genome) or creature.genome[trait_id] is None:
-                continue
-            
-            genotype_str = creature.genome[trait_id]
-            
+        for (genotype, sex), count in self._genotype_index().get(trait_id, {}).items():
             # Extract alleles based on trait type
-            if trait.trait_type.value == 'SEX_LINKED':
-                if creature.sex == 'male':
-                    # Male has single allele
-                    allele = genotype_str
-                    allele_counts[allele] = allele_counts.get(allele, 0) + 1
-                    total_alleles += 1
-                else:
-                    # Female has two alleles
-                    if len(genotype_str) == 2:
-                        for allele in genotype_str:
-                            allele_counts[allele] = allele_counts.get(allele, 0) + 1
-                            total_alleles += 1
-                    else:
-                        # Handle multi-character alleles (e.g., "Nc")
-                        # Simplified: treat as single allele for now
-                        allele_counts[genotype_str] = allele_counts.get(genotype_str, 0) + 1
-                        total_alleles += 1
-            else:
-                # Non-sex-linked: extract alleles
-                if '_' in genotype_str:
-                    # Polygenic: extract from each gene pair
-                    gene_pairs = genotype_str.split('_')
-                    for pair in gene_pairs:
-                        if len(pair) >= 2:
-                            mid = len(pair) // 2
-                            allele1 = pair[:mid]
-                            allele2 = pair[mid:]
-                            allele_counts[allele1] = allele_counts.get(allele1, 0) + 1
-                            allele_counts[allele2] = allele_counts.get(allele2, 0) + 1
-                            total_alleles += 2
-                else:
-                    # Simple: extract two alleles
-                    if len(genotype_str) == 2:
-                        for allele in genotype_str:
-                            allele_counts[allele] = allele_counts.get(allele, 0) + 1
-                            total_alleles += 1
-                    else:
-                        # Handle longer genotypes
-                        mid = len(genotype_str) // 2
-                        allele1 = genotype_str[:mid]
-                        allele2 = genotype_str[mid:]
-                        allele_counts[allele1] = allele_counts.get(allele1, 0) + 1
-                        allele_counts[allele2] = allele_counts.get(allele2, 0) + 1
-                        total_alleles += 1
+            alleles, allele_total = _split_alleles(genotype, sex_linked, sex)
+            for allele in alleles:
+                allele_counts[allele] += count
+            total_alleles += allele_total * count
         
         if total_alleles == 0:
             return {}
@@ -236,40 +430,16 @@ class Population:
         if not self.creatures:
             return 0.0
         
-        heterozygous_count = 0
-        total = 0
-        
-        for creature in self.creatures:
-            if trait_id >= len(creature.genome) or creature.genome[trait_id] is None:
-                continue
-            
-            genotype_str = creature.genome[trait_id]
-            total += 1
-            
-            # Check if heterozygous
-            # For simple genotypes, check if alleles differ
-            if '_' not in genotype_str:
-                if len(genotype_str) == 2:
-                    if genotype_str[0] != genotype_str[1]:
-                        heterozygous_count += 1
-                else:
-                    # Multi-character: check if halves differ
-                    mid = len(genotype_str) // 2
-                    if genotype_str[:mid] != genotype_str[mid:]:
-                        heterozygous_count += 1
-            else:
-                # Polygenic: check if any gene pair is heterozygous
-                gene_pairs = genotype_str.split('_')
-                for pair in gene_pairs:
-                    if len(pair) >= 2:
-                        mid = len(pair) // 2
-                        if pair[:mid] != pair[mid:]:
-                            heterozygous_count += 1
-                            break
+        # Classify each distinct genotype once rather than once per creature
+        genotype_counts = self._trait_genotype_counts(trait_id)
+        total = sum(genotype_counts.values())
         
         if total == 0:
             return 0.0
         
+        heterozygous_count = sum(
+            count for genotype, count in genotype_counts.items() if _is_heterozygous(genotype)
+        )
         return heterozygous_count / total
     
     def calculate_genotype_diversity(self, trait_id: int) -> int:
@@ -285,51 +455,131 @@ class Population:
         if not self.creatures:
             return 0
         
-        distinct_genotypes = set()
+        return len(self._trait_genotype_counts(trait_id))
+    
+    def calculate_trait_statistics(
+        self,
+        traits: List['Trait']
+    ) -> Tuple[Dict[int, Dict[str, float]], Dict[int, Dict[str, float]], np.ndarray, np.ndarray]:
+        """
+        Calculate genotype frequencies, allele frequencies, heterozygosity and
+        genotype diversity for every trait in a single pass over the population.
+        
+        All four statistics are derived from the running genotype counts, which
+        add_creatures/remove_aged_out_creatures keep up to date, so the cost is
+        proportional to the number of distinct genotypes rather than creatures.
+        Results match the per-trait calculate_* methods.
+        
+        Results are cached until the working pool changes (creatures added or
+        aged out), so cycles without demographic change skip the recomputation.
+        Cached dicts and arrays are shared between calls and must not be mutated.
         
-        for creature in self.creatures:
-            if trait_id < len(creature.genome) and creature.genome[trait_id] is not None:
-                distinct_genotypes.add(creature.genome[trait_id])
+        Args:
+            traits: Traits to calculate statistics for
+            
+        Returns:
+            Tuple of (genotype_frequencies, allele_frequencies, heterozygosity,
+            genotype_diversity). The frequency dicts are keyed by trait_id; the
+            heterozygosity (float64) and genotype_diversity (int64) arrays are
+            aligned with the order of traits
+        """
+        cache_key = (
+            self._version,
+            id(self.creatures),
+            len(self.creatures),
+            tuple((t.trait_id, t.trait_type) for t in traits)
+        )
+        if self._trait_stats_cache is not None and self._trait_stats_cache[0] == cache_key:
+            return self._trait_stats_cache[1]
+        
+        result = self._compute_trait_statistics(traits)
+        self._trait_stats_cache = (cache_key, result)
+        return result
+    
+    def _compute_trait_statistics(
+        self,
+        traits: List['Trait']
+    ) -> Tuple[Dict[int, Dict[str, float]], Dict[int, Dict[str, float]], np.ndarray, np.ndarray]:
+        """Uncached implementation of calculate_trait_statistics."""
+        genotype_frequencies: Dict[int, Dict[str, float]] = {}
+        allele_frequencies: Dict[int, Dict[str, float]] = {}
+        heterozygosity = np.zeros(len(traits), dtype=np.float64)
+        genotype_diversity = np.zeros(len(traits), dtype=np.int64)
+        
+        if not self.creatures:
+            for trait in traits:
+                genotype_frequencies[trait.trait_id] = {}
+                allele_frequencies[trait.trait_id] = {}
+            return genotype_frequencies, allele_frequencies, heterozygosity, genotype_diversity
+        
+        index = self._genotype_index()
+        
+        for column_index, trait in enumerate(traits):
+            trait_id = trait.trait_id
+            # Sorted so the output order is stable regardless of arrival order
+            trait_counts = sorted(index.get(trait_id, {}).items())
+            genotype_counts: Dict[str, int] = defaultdict(int)
+            for (genotype, _), count in trait_counts:
+                genotype_counts[genotype] += count
+            total = sum(genotype_counts.values())
+            
+            if total == 0:
+                genotype_frequencies[trait_id] = {}
+                allele_frequencies[trait_id] = {}
+                continue
+            
+            genotype_frequencies[trait_id] = {
+                genotype: count / total for genotype, count in genotype_counts.items()
+            }
+            genotype_diversity[column_index] = len(genotype_counts)
+            heterozygosity[column_index] = sum(
+                count for genotype, count in genotype_counts.items() if _is_heterozygous(genotype)
+            ) / total
+            
+            # Allele extraction for sex-linked traits depends on sex, so count
+            # males and females separately
+            if trait.is_sex_linked:
+                groups = [
+                    ('male', [(g, n) for (g, sex), n in trait_counts if sex == 'male']),
+                    ('female', [(g, n) for (g, sex), n in trait_counts if sex != 'male'])
+                ]
+            else:
+                groups = [(None, genotype_counts.items())]
+            
+            allele_counts: Dict[str, int] = defaultdict(int)
+            total_alleles = 0
+            for sex, sex_genotype_counts in groups:
+                for genotype, count in sex_genotype_counts:
+                    alleles, allele_total = _split_alleles(genotype, sex is not None, sex)
+                    for allele in alleles:
+                        allele_counts[allele] += count
+                    total_alleles += allele_total * count
+            
+            allele_frequencies[trait_id] = (
+                {allele: count / total_alleles for allele, count in allele_counts.items()}
+                if total_alleles else {}
+            )
         
-        return len(distinct_genotypes)
+        return genotype_frequencies, allele_frequencies, heterozygosity, genotype_diversity
     
     def _persist_creatures(self, db_conn, simulation_id: int, creatures: List[Creature]) -> None:
         """
         Persist creatures to database immediately upon creation.
         
         This method is called for all creatures (founders and offspring) immediately
-        when they are created to ensure they have IDs from the start.
+        when they are created to ensure they have IDs from the start. It does not
+        commit; the caller owns the transaction (one per cycle).
         
         Args:
             db_conn: Database connection
             simulation_id: Simulation ID
             creatures: List of creatures to persist (must not already be persisted)
         """
-        import sqlite3
-        
+        if not creatures:
+            return
         cursor = db_conn.cursor()
         
-        # Create mapping of all creatures (in population and being persisted) to their IDs
-        creature_id_map = {}
-        for c in self.creatures:
-            if c.creature_id is not None:
-                creature_id_map[id(c)] = c.creature_id
-        
-        # First pass: Persist any parents that are in the population but not yet persisted
-        # and are needed by creatures being persisted
-        parents_to_persist = set()
-        for creature in creatures:
-            if creature.birth_cycle > 0:  # Offspring
-                # Find parents in population
-                for parent in self.creatures:
-                    if parent.creature_id is None and parent not in creatures:
-                        # Check if this parent matches (simplified: check by birth_cycle and simulation)
-                        # In a full implementation, we'd track parent references explicitly
-                        if (creature.parent1_id is None or creature.parent2_id is None):
-                            # We'll handle this by updating parent IDs after parents are persisted
-                            pass
-        
-        # Batch insert creatures
+        creature_rows = []
         for creature in creatures:
             parent1_id = creature.parent1_id
             parent2_id = creature.parent2_id
@@ -351,14 +601,7 @@ class Population:
                         f"with NULL parent IDs. Parent IDs must be set before persistence."
                     )
             
-            cursor.execute("""
-                INSERT INTO creatures (
-                    simulation_id, birth_cycle, sex, parent1_id, parent2_id, breeder_id,
-                    produced_by_breeder_id, inbreeding_coefficient, lifespan, is_alive,
-                    conception_cycle, sexual_maturity_cycle, max_fertility_age_cycle,
-                    gestation_end_cycle, nursing_end_cycle, generation
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            creature_rows.append((
                 simulation_id,
                 creature.birth_cycle,
                 creature.sex,
@@ -376,19 +619,22 @@ class Population:
                 creature.nursing_end_cycle,
                 creature.generation
             ))
-            creature_id = cursor.lastrowid
+        
+        # Insert all creatures in one executemany. The connection holds the write
+        # lock for the whole statement batch, so AUTOINCREMENT hands out consecutive
+        # IDs ending at last_insert_rowid(); assign them back in insertion order.
+        cursor.executemany(SQL_INSERT_CREATURE, creature_rows)
+        last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+        
+        genotype_rows = []
+        for creature_id, creature in enumerate(creatures, last_id - len(creatures) + 1):
             creature.creature_id = creature_id
-            
-            # Update creature_id_map for future parent lookups
-            creature_id_map[id(creature)] = creature_id
-            
-            # Insert genotypes
-            for trait_id, genotype in enumerate(creature.genome):
-                if genotype is not None:
-                    cursor.execute("""
-                        INSERT INTO creature_genotypes (creature_id, trait_id, genotype)
-                        VALUES (?, ?, ?)
-                    """, (creature_id, trait_id, genotype))
-        
-        db_conn.commit()
+            genotype_rows.extend(
+                (creature_id, trait_id, genotype)
+                for trait_id, genotype in enumerate(creature.genome)
+                if genotype is not None
+            )
+        
+        # Batch insert genotypes
+        cursor.executemany(SQL_INSERT_CREATURE_GENOTYPE, genotype_rows)
 
@@ -1,8 +1,9 @@
 """Trait and Genotype models for gene_sim."""
 
 from enum import Enum
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Any, Tuple
+from dataclasses import dataclass, field
+import numpy as np
 
 
 class TraitType(Enum):
@@ -14,7 +15,7 @@ class TraitType(Enum):
     POLYGENIC = "POLYGENIC"
 
 
-@dataclass
+@dataclass(slots=True)
 class Genotype:
     """Represents a genotype with its phenotype mapping."""
     genotype: str  # e.g., "BB", "Bb", "bb", "H1H1_H2H2_H3H3"
@@ -30,7 +31,7 @@ class Genotype:
             raise ValueError(f"sex must be 'male' or 'female', got {self.sex}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Trait:
     """Represents a genetic trait with its possible genotypes."""
     trait_id: int  # 0-99
@@ -38,6 +39,15 @@ class Trait:
     trait_type: TraitType
     genotypes: List[Genotype]
     
+    # Lookup tables derived from genotypes in __post_init__
+    idx_to_genotype: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    genotype_to_idx: Dict[str, int] = field(init=False, repr=False, compare=False)
+    is_sex_linked: bool = field(init=False, repr=False, compare=False)
+    _probs: np.ndarray = field(init=False, repr=False, compare=False)
+    _cdf: np.ndarray = field(init=False, repr=False, compare=False)
+    _phenotypes: Dict[Any, str] = field(init=False, repr=False, compare=False)
+    _crosses: Dict[Tuple[str, str], Optional[tuple]] = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate trait data."""
         if not (0 <= self.trait_id < 100):
@@ -55,6 +65,32 @@ class Trait:
             for genotype in self.genotypes:
                 if genotype.sex is None:
                     raise ValueError(f"Trait {self.trait_id} (SEX_LINKED) genotype {genotype.genotype} must specify sex")
+        
+        # Sampling probabilities, built once rather than on every draw
+        self._probs = np.fromiter((g.initial_freq for g in self.genotypes), dtype=np.float64,
+                                  count=len(self.genotypes))
+        # Normalized cumulative distribution, computed exactly as Generator.choice
+        # does internally so sample_many draws match choice(p=...) draw for draw
+        self._cdf = np.cumsum(self._probs)
+        self._cdf /= self._cdf[-1]
+        
+        # Compact index over the distinct genotype strings. Offspring genotypes are
+        # mapped back onto these objects so every creature shares one string per
+        # genotype, whose hash is computed once and compares by identity.
+        self.idx_to_genotype = tuple(dict.fromkeys(g.genotype for g in self.genotypes))
+        self.genotype_to_idx = {g: i for i, g in enumerate(self.idx_to_genotype)}
+        
+        # Resolved once; inheritance checks this per child per trait
+        self.is_sex_linked = self.trait_type == TraitType.SEX_LINKED
+        # Offspring genotype tables for single-gene-pair crosses, filled on demand
+        self._crosses = {}
+        
+        # Phenotype lookup table; sex-linked traits key on (genotype, sex).
+        # setdefault keeps the first matching genotype, as the linear scan did.
+        self._phenotypes = {}
+        for genotype in self.genotypes:
+            key = (genotype.genotype, genotype.sex) if self.is_sex_linked else genotype.genotype
+            self._phenotypes.setdefault(key, genotype.phenotype)
     
     def get_phenotype(self, genotype_str: str, sex: Optional[str] = None) -> Optional[str]:
         """
@@ -67,15 +103,54 @@ class Trait:
         Returns:
             Phenotype string, or None if not found
         """
-        for genotype in self.genotypes:
-            if genotype.genotype == genotype_str:
-                # For sex-linked traits, sex must match
-                if self.trait_type == TraitType.SEX_LINKED:
-                    if genotype.sex == sex:
-                        return genotype.phenotype
-                else:
-                    return genotype.phenotype
-        return None
+        if self.is_sex_linked:
+            return self._phenotypes.get((genotype_str, sex))
+        return self._phenotypes.get(genotype_str)
+    
+    def intern_genotype(self, genotype_str: str) -> str:
+        """
+        Return this trait's shared string object for a genotype.
+        
+        Args:
+            genotype_str: Genotype string, typically freshly built from gametes
+            
+        Returns:
+            The canonical string from idx_to_genotype, or genotype_str unchanged
+            if the trait does not define that genotype
+        """
+        idx = self.genotype_to_idx.get(genotype_str)
+        return genotype_str if idx is None else self.idx_to_genotype[idx]
+    
+    def cross(self, genotype1: str, genotype2: str) -> Optional[Tuple[Tuple[str, str], Tuple[str, str]]]:
+        """
+        Get the offspring genotypes of a single-gene-pair autosomal cross, memoized.
+        
+        Args:
+            genotype1: First parent's genotype
+            genotype2: Second parent's genotype
+            
+        Returns:
+            Table where table[i][j] is the child's (interned, allele-ordered) genotype
+            when it inherits allele i of genotype1 and allele j of genotype2, indexed
+            as Creature.produce_gamete splits them; None for sex-linked traits and
+            polygenic genotypes, which inherit gene pair by gene pair
+        """
+        key = (genotype1, genotype2)
+        try:
+            return self._crosses[key]
+        except KeyError:
+            pass
+        table = None
+        if not self.is_sex_linked and '_' not in genotype1 and '_' not in genotype2:
+            mid1 = len(genotype1) // 2
+            mid2 = len(genotype2) // 2
+            table = tuple(
+                tuple(self.intern_genotype(a + b if a <= b else b + a)
+                      for b in (genotype2[:mid2], genotype2[mid2:]))
+                for a in (genotype1[:mid1], genotype1[mid1:])
+            )
+        self._crosses[key] = table
+        return table
     
     def get_genotype_by_frequency(self, rng) -> Genotype:
         """
@@ -87,10 +162,26 @@ class Trait:
         Returns:
             Randomly sampled Genotype based on frequencies
         """
-        probs = [g.initial_freq for g in self.genotypes]
-        idx = rng.choice(len(self.genotypes), p=probs)
+        # Binary search on the cached cumulative distribution; same draw as
+        # rng.choice(p=...) without rebuilding the CDF on every call
+        idx = self._cdf.searchsorted(rng.random(), side='right')
         return self.genotypes[idx]
     
+    def sample_many(self, rng, n: int) -> np.ndarray:
+        """
+        Sample n genotypes based on initial frequencies in a single draw.
+        
+        Args:
+            rng: NumPy random number generator
+            n: Number of genotypes to sample
+            
+        Returns:
+            Array of n indices into self.genotypes
+        """
+        # Inverse-CDF lookup against the precomputed distribution; skips the
+        # per-call argument validation and cumsum of rng.choice(p=...)
+        return self._cdf.searchsorted(rng.random(n), side='right')
+    
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> 'Trait':
         """
@@ -1,14 +1,14 @@
 """Simulation engine for gene_sim."""
 
-import json
+import copy
 import sqlite3
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 import numpy as np
 
-from .config import load_config, SimulationConfig
+from .config import load_config, load_config_from_dict, SimulationConfig
 from .exceptions import SimulationError, DatabaseError
 from .database import create_database, get_db_connection
 from .models.trait import Trait
@@ -39,20 +39,29 @@ class SimulationResults:
 class Simulation:
     """Main simulation class that orchestrates the simulation lifecycle."""
     
-    def __init__(self, config_path: str, db_path: Optional[str] = None):
+    def __init__(
+        self,
+        config_path: Optional[str],
+        db_path: Optional[str] = None,
+        *,
+        config: Optional[SimulationConfig] = None
+    ):
         """
         Initialize simulation from configuration file.
         
         Args:
-            config_path: Path to YAML/JSON configuration file
+            config_path: Path to YAML/JSON configuration file (None when config is given)
             db_path: Optional path for SQLite database. If None, database is created
-                    in the same directory as config_path with name 
-                    'simulation_YYYYMMDD_HHMMSS.db'
+                    in the same directory as config_path (or the current directory)
+                    with name 'simulation_YYYYMMDD_HHMMSS.db'. ':memory:' keeps the
+                    database in memory; it is discarded when the run finishes
+            config: Already-loaded configuration; skips reading config_path
         """
         self.config_path = config_path
-        self.config = load_config(config_path)
+        self.config = config if config is not None else load_config(config_path)
         self.db_path = db_path or self._generate_db_path()
         self.db_conn: Optional[sqlite3.Connection] = None
+        self._cursor: Optional[sqlite3.Cursor] = None  # Shared by all simulation-level writes
         self.simulation_id: Optional[int] = None
         self.rng: Optional[np.random.Generator] = None
         self.population: Optional[Population] = None
@@ -75,9 +84,27 @@ class Simulation:
         """
         return cls(config_path, db_path)
     
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any], db_path: Optional[str] = None) -> 'Simulation':
+        """
+        Create a Simulation instance from an in-memory configuration dictionary.
+        
+        The dictionary is validated exactly like a configuration file, without the
+        file round trip. It is copied first, so the caller's dict is left as is.
+        
+        Args:
+            config: Configuration dictionary with the same layout as a config file
+            db_path: Optional path for SQLite database. If None, database is created
+                    in the current directory with name 'simulation_YYYYMMDD_HHMMSS.db'
+        
+        Returns:
+            Initialized Simulation instance
+        """
+        return cls(None, db_path, config=load_config_from_dict(copy.deepcopy(config)))
+    
     def _generate_db_path(self) -> str:
         """Generate default database path based on config file location."""
-        config_dir = Path(self.config_path).parent
+        config_dir = Path(self.config_path).parent if self.config_path else Path.cwd()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         db_name = f"simulation_{timestamp}.db"
         return str(config_dir / db_name)
@@ -87,6 +114,7 @@ class Simulation:
         try:
             # Create database and schema
             self.db_conn = create_database(self.db_path)
+            self._cursor = self.db_conn.cursor()
             
             # Initialize RNG with seed
             self.rng = np.random.Generator(np.random.PCG64(self.config.seed))
@@ -102,61 +130,57 @@ class Simulation:
                 for tc in self.config.traits
             ]
             
-            # Persist traits to database
-            self._persist_traits()
-            
-            # Create simulation record (must be done before creating breeders and founders)
-            self._create_simulation_record()
-            
-            # Create breeders (must be done before creating founders so founders can be assigned)
-            self._create_breeders()
-            
-            # Create initial population
-            self.population = Population()
-            self._create_initial_population()
-            
-            # Persist founders immediately so they all have IDs from the start
-            self._persist_founders()
+            # All initialization writes form one transaction, committed on exit
+            with self.db_conn:
+                # Persist traits to database
+                self._persist_traits()
+                
+                # Create simulation record (must be done before creating breeders and founders)
+                self._create_simulation_record()
+                
+                # Create breeders (must be done before creating founders so founders can be assigned)
+                self._create_breeders()
+                
+                # Create initial population
+                self.population = Population()
+                founders = self._create_initial_population()
+                
+                # Persist founders immediately so they all have IDs from the start
+                self._persist_founders(founders)
             
             # Initialize cycle-based fields for founders
-            self._initialize_founder_cycles()
+            self._initialize_founder_cycles(founders)
             
         except Exception as e:
             raise SimulationError(f"Failed to initialize simulation: {e}") from e
     
     def _persist_traits(self) -> None:
         """Persist trait definitions to database."""
-        cursor = self.db_conn.cursor()
+        cursor = self._cursor
         
-        for trait in self.traits:
-            # Insert trait (ignore if already exists - allows multiple simulations in same DB)
-            cursor.execute("""
-                INSERT OR IGNORE INTO traits (trait_id, name, trait_type)
-                VALUES (?, ?, ?)
-            """, (trait.trait_id, trait.name, trait.trait_type.value))
-            
-            # Insert genotypes (ignore if already exists)
-            for genotype in trait.genotypes:
-                cursor.execute("""
-                    INSERT OR IGNORE INTO genotypes (
-                        trait_id, genotype, phenotype, sex, initial_freq
-                    ) VALUES (?, ?, ?, ?, ?)
-                """, (
-                    trait.trait_id,
-                    genotype.genotype,
-                    genotype.phenotype,
-                    genotype.sex,
-                    genotype.initial_freq
-                ))
+        # Insert traits and genotypes (ignore if already exist - allows multiple
+        # simulations in same DB), one executemany per table
+        cursor.executemany("""
+            INSERT OR IGNORE INTO traits (trait_id, name, trait_type)
+            VALUES (?, ?, ?)
+        """, [(trait.trait_id, trait.name, trait.trait_type.value) for trait in self.traits])
         
-        self.db_conn.commit()
+        cursor.executemany("""
+            INSERT OR IGNORE INTO genotypes (
+                trait_id, genotype, phenotype, sex, initial_freq
+            ) VALUES (?, ?, ?, ?, ?)
+        """, [
+            (trait.trait_id, genotype.genotype, genotype.phenotype, genotype.sex, genotype.initial_freq)
+            for trait in self.traits
+            for genotype in trait.genotypes
+        ])
     
     def _create_breeders(self) -> None:
         """Create breeder instances according to configuration and persist to database."""
         breeders = []
         breeder_index = 0
         
-        cursor = self.db_conn.cursor()
+        cursor = self._cursor
         
         # Random breeders
         for _ in range(self.config.breeders.random):
@@ -229,61 +253,75 @@ class Simulation:
             breeder.breeder_id = cursor.lastrowid
             breeder_index += 1
         
-        self.db_conn.commit()
         self.breeders = breeders
     
-    def _initialize_founder_cycles(self) -> None:
-        """Initialize cycle-based fields for founders."""
+    def _initialize_founder_cycles(self, founders: List[Creature]) -> None:
+        """
+        Initialize cycle-based fields for founders.
+        
+        Args:
+            founders: Founder creatures returned by _create_initial_population
+        """
         archetype = self.config.creature_archetype
         
-        for creature in self.population.creatures:
-            if creature.birth_cycle == 0:  # Founders
-                # Founders are born at cycle 0, so they're already mature
-                # Calculate sexual maturity cycle (0 for founders, they start mature)
-                maturity_cycles = archetype.maturity_cycles
-                creature.sexual_maturity_cycle = 0  # Founders start mature
-                
-                # Calculate max_fertility_age_cycle
-                max_fertility_age_years = archetype.max_fertility_age_years[creature.sex]
-                cycles_per_year = 365.25 / archetype.menstrual_cycle_days
-                creature.max_fertility_age_cycle = int(max_fertility_age_years * cycles_per_year)
-                
-                # Founders have no conception cycle
-                creature.conception_cycle = None
-                creature.generation = 0  # Founders are generation 0
+        # Fertility windows depend only on sex
+        max_fertility_age_cycles = archetype.fertility_window_cycles
+        
+        for creature in founders:
+            # Founders are born at cycle 0, so they're already mature
+            creature.sexual_maturity_cycle = 0
+            creature.max_fertility_age_cycle = max_fertility_age_cycles[creature.sex]
+            
+            # Founders have no conception cycle
+            creature.conception_cycle = None
+            creature.generation = 0  # Founders are generation 0
     
-    def _create_initial_population(self) -> None:
-        """Create initial population of founders."""
+    def _create_initial_population(self) -> List[Creature]:
+        """
+        Create initial population of founders.
+        
+        Returns:
+            The founder creatures, in the order they were added to the population
+        """
         founders = []
+        n_founders = self.config.initial_population_size
+        archetype = self.config.creature_archetype
         
         # Determine max trait_id for genome size
         max_trait_id = max(t.trait_id for t in self.traits) if self.traits else 0
         
-        for i in range(self.config.initial_population_size):
-            # Determine sex based on initial_sex_ratio
-            sex_prob = self.config.initial_sex_ratio['female']
-            sex = 'female' if self.rng.random() < sex_prob else 'male'
-            
-            # Create genome by sampling genotypes
-            genome: list = [None] * (max_trait_id + 1)
-            for trait in self.traits:
-                genotype = trait.get_genotype_by_frequency(self.rng)
-                genome[trait.trait_id] = genotype.genotype
-            
-            # Sample lifespan (in cycles)
-            lifespan = self.rng.integers(
-                self.config.creature_archetype.lifespan_cycles_min,
-                self.config.creature_archetype.lifespan_cycles_max + 1
-            )
-            
-            # Assign founder to a breeder (distribute evenly)
-            breeder_index = i % len(self.breeders) if self.breeders else 0
-            breeder_id = self.breeders[breeder_index].breeder_id if self.breeders else None
+        # Draw every founder's sex, lifespan and genome in batched RNG calls, one
+        # array per attribute, instead of one scalar draw per founder per field
+        is_female = (self.rng.random(n_founders) < self.config.initial_sex_ratio['female']).tolist()
+        
+        # Sample lifespans (in cycles)
+        lifespans = self.rng.integers(
+            archetype.lifespan_cycles_min,
+            archetype.lifespan_cycles_max + 1,
+            size=n_founders
+        ).tolist()
+        
+        # One column of genotype strings per trait_id (None for unused IDs), gathered
+        # from the sampled indices, then transposed into per-founder genome tuples
+        genome_columns: list = [[None] * n_founders for _ in range(max_trait_id + 1)]
+        for trait in self.traits:
+            indices = trait.sample_many(self.rng, n_founders)
+            # Gather through the trait's interned strings so founders share them with offspring
+            genotype_strs = np.array([trait.intern_genotype(g.genotype) for g in trait.genotypes], dtype=object)
+            genome_columns[trait.trait_id] = genotype_strs[indices].tolist()
+        genomes = list(zip(*genome_columns))
+        
+        # Founders are assigned to breeders round-robin (distributed evenly)
+        breeder_ids = [breeder.breeder_id for breeder in self.breeders]
+        n_breeders = len(breeder_ids)
+        
+        for i, (female, lifespan, genome) in enumerate(zip(is_female, lifespans, genomes)):
+            breeder_id = breeder_ids[i % n_breeders] if n_breeders else None
             
             creature = Creature(
                 simulation_id=0,  # Will be updated after simulation record created
                 birth_cycle=0,
-                sex=sex,
+                sex='female' if female else 'male',
                 genome=genome,
                 parent1_id=None,
                 parent2_id=None,
@@ -297,13 +335,14 @@ class Simulation:
         
         # Add founders to population with current_cycle=0
         self.population.add_creatures(founders, current_cycle=0)
+        return founders
     
     def _create_simulation_record(self) -> None:
         """Create simulation record in database."""
-        cursor = self.db_conn.cursor()
+        cursor = self._cursor
         
-        # Store config as JSON text
-        config_text = json.dumps(self.config.raw_config)
+        # Store config as JSON text (serialized once per config)
+        config_text = self.config.raw_config_json
         
         cursor.execute("""
             INSERT INTO simulations (
@@ -315,17 +354,17 @@ class Simulation:
         
         # Note: Creature simulation_ids will be updated in _persist_founders
     
-    def _persist_founders(self) -> None:
+    def _persist_founders(self, founders: List[Creature]) -> None:
         """
         Persist founder creatures to database immediately upon creation.
         
         All creatures must be persisted immediately to ensure they have IDs from the start.
         This method persists all founders right after they are created and before any
         breeding occurs.
-        """
-        # Get all founders (birth_cycle = 0)
-        founders = [c for c in self.population.creatures if c.birth_cycle == 0]
         
+        Args:
+            founders: Founder creatures returned by _create_initial_population
+        """
         # Update simulation_id for all founders
         for creature in founders:
             creature.simulation_id = self.simulation_id
@@ -333,8 +372,6 @@ class Simulation:
         if founders:
             # Persist founders to database immediately
             self.population._persist_creatures(self.db_conn, self.simulation_id, founders)
-        
-        self.db_conn.commit()
     
     def run(self) -> SimulationResults:
         """
@@ -347,6 +384,8 @@ class Simulation:
             SimulationError: If simulation fails during execution
         """
         start_time = datetime.now()
+        cycle = None
+        cycles_completed = 0
         
         try:
             # Initialize if not already done
@@ -372,7 +411,8 @@ class Simulation:
                 )
                 
                 # Update simulation progress
-                self._update_simulation_progress(cycle_num + 1, len(self.population.creatures))
+                cycles_completed = cycle_num + 1
+                self._update_simulation_progress(cycles_completed, len(self.population.creatures))
                 
                 # Monitor mode output
                 if self.config.mode == 'monitor':
@@ -380,7 +420,8 @@ class Simulation:
             
             # Finalize simulation
             end_time = datetime.now()
-            self._finalize_simulation(end_time, len(self.population.creatures))
+            final_population_size = len(self.population.creatures)
+            self._finalize_simulation(end_time, final_population_size)
             
             # Print final newline in monitor mode for clean output
             if self.config.mode == 'monitor':
@@ -394,7 +435,7 @@ class Simulation:
                 seed=self.config.seed,
                 status='completed',
                 generations_completed=self.config.cycles,  # Store cycles in generations_completed (database column name)
-                final_population_size=len(self.population.creatures),
+                final_population_size=final_population_size,
                 database_path=self.db_path,
                 config=self.config.raw_config,
                 start_time=start_time,
@@ -406,31 +447,42 @@ class Simulation:
             # Mark simulation as failed
             if self.db_conn and self.simulation_id:
                 try:
-                    cursor = self.db_conn.cursor()
+                    cursor = self._cursor
+                    # A failing cycle rolls back its transaction, including the
+                    # uncommitted progress update, so record progress here too
                     cursor.execute("""
                         UPDATE simulations
-                        SET status = 'failed', end_time = ?
+                        SET status = 'failed', end_time = ?, generations_completed = ?
                         WHERE simulation_id = ?
-                    """, (datetime.now().isoformat(), self.simulation_id))
+                    """, (datetime.now().isoformat(), cycles_completed, self.simulation_id))
                     self.db_conn.commit()
                 except:
                     pass
             
             raise SimulationError(f"Simulation failed: {e}") from e
         finally:
+            # Stop offspring worker processes, if any were started
+            if cycle is not None:
+                cycle.close()
+            
             # Close database connection
             if self.db_conn:
                 self.db_conn.close()
     
     def _update_simulation_progress(self, generations_completed: int, population_size: int) -> None:
-        """Update simulation progress in database."""
-        cursor = self.db_conn.cursor()
+        """
+        Update simulation progress in database.
+        
+        The update is left uncommitted: it is committed together with the next
+        cycle's transaction, or by _finalize_simulation after the last cycle, which
+        saves a separate commit per cycle.
+        """
+        cursor = self._cursor
         cursor.execute("""
             UPDATE simulations
             SET generations_completed = ?, updated_at = ?
             WHERE simulation_id = ?
         """, (generations_completed, datetime.now().isoformat(), self.simulation_id))
-        self.db_conn.commit()
     
     def _calculate_desired_trait_penetration(self) -> float:
         """Calculate percentage of population with desired (target) phenotypes."""
@@ -480,11 +532,12 @@ class Simulation:
     
     def _finalize_simulation(self, end_time: datetime, final_population_size: int) -> None:
         """Finalize simulation record."""
-        cursor = self.db_conn.cursor()
+        end_time_iso = end_time.isoformat()
+        cursor = self._cursor
         cursor.execute("""
             UPDATE simulations
             SET status = 'completed', end_time = ?, final_population_size = ?, updated_at = ?
             WHERE simulation_id = ?
-        """, (end_time.isoformat(), final_population_size, end_time.isoformat(), self.simulation_id))
+        """, (end_time_iso, final_population_size, end_time_iso, self.simulation_id))
         self.db_conn.commit()
 
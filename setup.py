@@ -7,7 +7,7 @@ setup(
     author="Gene Sim Team",
     packages=find_packages(),
     install_requires=[
-        "numpy>=1.24.0",
+        "numpy>=1.25.0",
         "pyyaml>=6.0",
     ],
     python_requires=">=3.10",
@@ -16,6 +16,9 @@ setup(
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
         ],
+        "fast": [
+            "orjson>=3.9",
+        ],
     },
 )
 
@@ -0,0 +1,47 @@
+"""Shared pytest fixtures."""
+
+import sqlite3
+
+import pytest
+
+from gene_sim.database import connection
+from gene_sim.database.schema import create_schema
+
+
+@pytest.fixture(autouse=True)
+def _unsynced_simulation_databases(monkeypatch):
+    """
+    Skip fsyncs on the databases simulations create during tests.
+    
+    Test databases are throwaway, so durability buys nothing. Only the module-level
+    lookup used by create_database is patched; tests that import get_db_connection
+    directly still see the production PRAGMAs.
+    """
+    get_db_connection = connection.get_db_connection
+    
+    def _connect(db_path: str) -> sqlite3.Connection:
+        conn = get_db_connection(db_path)
+        conn.execute("PRAGMA synchronous = OFF")
+        return conn
+    
+    monkeypatch.setattr(connection, 'get_db_connection', _connect)
+
+
+@pytest.fixture(scope="session")
+def _schema_template():
+    """In-memory database holding the schema, built once per test session."""
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def memdb(_schema_template):
+    """In-memory SQLite database with the schema created and foreign keys on."""
+    conn = sqlite3.connect(":memory:")
+    # Page copy of the template; cheaper than re-running the DDL for every test
+    _schema_template.backup(conn)
+    conn.execute("PRAGMA foreign_keys = ON")
+    yield conn
+    conn.close()
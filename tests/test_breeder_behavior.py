@@ -247,7 +247,66 @@ def test_breeder_fallback_when_no_target_phenotype_available(creatures_with_phen
     assert len(pairs) == num_pairs
     
     # Pairs should be valid creatures (just not matching the non-existent target)
+    male_ids = {id(c) for c in eligible_males}
+    female_ids = {id(c) for c in eligible_females}
     for male, female in pairs:
-        assert male in eligible_males
-        assert female in eligible_females
+        assert id(male) in male_ids
+        assert id(female) in female_ids
 
+
+
+def test_breeder_phenotype_memo_follows_trait_definitions(sample_trait):
+    """Test memoized phenotypes are recomputed when a different traits list is passed."""
+    breeder = MillBreeder(target_phenotypes=[{'trait_id': 0, 'phenotype': 'Black'}])
+    creature = Creature(simulation_id=1, birth_cycle=0, sex="male", genome=["Bb"], lifespan=100)
+    
+    assert breeder._matches_target_phenotypes(creature, [sample_trait])
+    
+    recessive_trait = Trait(0, "Coat Color", TraitType.SIMPLE_MENDELIAN, [
+        Genotype("BB", "Black", 0.25),
+        Genotype("Bb", "Brown", 0.50),
+        Genotype("bb", "Brown", 0.25),
+    ])
+    assert not breeder._matches_target_phenotypes(creature, [recessive_trait])
+    assert breeder._phenotype(creature, 5, [recessive_trait]) is None
+
+
+def test_breeder_candidate_pools_shared_within_cycle(creatures_with_phenotypes, sample_trait):
+    """Test identically configured breeders reuse candidate pools through the cycle's pool cache."""
+    traits = [sample_trait]
+    males = creatures_with_phenotypes['all_males']
+    females = creatures_with_phenotypes['all_females']
+    
+    black1 = KennelClubBreeder(target_phenotypes=[{'trait_id': 0, 'phenotype': 'Black'}])
+    black2 = KennelClubBreeder(target_phenotypes=[{'trait_id': 0, 'phenotype': 'Black'}])
+    brown = KennelClubBreeder(target_phenotypes=[{'trait_id': 0, 'phenotype': 'Brown'}])
+    
+    # Without a cycle's pool cache nothing is kept between calls
+    assert black1._candidate_pools(males, females, traits) is not black1._candidate_pools(males, females, traits)
+    
+    pool_cache = {}
+    for breeder in (black1, black2, brown):
+        breeder._pool_cache = pool_cache
+    pools = black1._candidate_pools(males, females, traits)
+    assert black2._candidate_pools(males, females, traits) is pools
+    assert brown._candidate_pools(males, females, traits) is not pools
+    assert len(pool_cache) == 2
+
+
+def test_kennel_club_breeder_always_excludes_undesirable_genotypes(creatures_with_phenotypes, sample_trait):
+    """Test kennel club breeders drop every listed genotype even without the avoidance flag."""
+    breeder = KennelClubBreeder(
+        target_phenotypes=[],
+        undesirable_genotypes=[{'trait_id': 0, 'genotype': 'BB'}, {'trait_id': 0, 'genotype': 'bb'}],
+        avoid_undesirable_genotypes=False
+    )
+    
+    pairs = breeder.select_pairs(
+        creatures_with_phenotypes['all_males'], creatures_with_phenotypes['all_females'],
+        10, np.random.Generator(np.random.PCG64(46)), [sample_trait]
+    )
+    
+    assert len(pairs) == 10
+    for male, female in pairs:
+        assert male.genome[0] == "Bb"
+        assert female.genome[0] == "Bb"
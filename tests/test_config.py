@@ -1,10 +1,8 @@
 """Tests for configuration system."""
 
 import pytest
-import tempfile
 import yaml
-from pathlib import Path
-from gene_sim.config import load_config, ConfigurationError
+from gene_sim.config import load_config, load_config_from_dict, ConfigurationError
 
 
 @pytest.fixture
@@ -47,51 +45,39 @@ def sample_config():
     }
 
 
-def test_load_config_yaml(sample_config):
+def test_load_config_yaml(sample_config, tmp_path):
     """Test loading YAML configuration."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(sample_config, f)
-        config_path = f.name
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text(yaml.safe_dump(sample_config))
     
-    try:
-        config = load_config(config_path)
-        assert config.seed == 42
-        assert config.years == 0.5
-        assert config.cycles > 0  # Should be calculated
-        assert config.initial_population_size == 100
-        assert len(config.traits) == 1
-    finally:
-        Path(config_path).unlink()
+    config = load_config(str(config_path))
+    assert config.seed == 42
+    assert config.years == 0.5
+    assert config.cycles > 0  # Should be calculated
+    assert config.initial_population_size == 100
+    assert len(config.traits) == 1
+
+
+def test_load_config_missing_file(tmp_path):
+    """Test that a missing configuration file raises error."""
+    with pytest.raises(ConfigurationError):
+        load_config(str(tmp_path / 'missing.yaml'))
 
 
 def test_load_config_missing_field(sample_config):
     """Test that missing required fields raise errors."""
     del sample_config['seed']
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(sample_config, f)
-        config_path = f.name
-    
-    try:
-        with pytest.raises(ConfigurationError):
-            load_config(config_path)
-    finally:
-        Path(config_path).unlink()
+    with pytest.raises(ConfigurationError):
+        load_config_from_dict(sample_config)
 
 
 def test_load_config_invalid_trait_id(sample_config):
     """Test that invalid trait_id raises error."""
     sample_config['traits'][0]['trait_id'] = 100  # Invalid
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(sample_config, f)
-        config_path = f.name
-    
-    try:
-        with pytest.raises(ConfigurationError):
-            load_config(config_path)
-    finally:
-        Path(config_path).unlink()
+    with pytest.raises(ConfigurationError):
+        load_config_from_dict(sample_config)
 
 
 def test_load_config_normalizes_frequencies(sample_config):
@@ -101,15 +87,15 @@ def test_load_config_normalizes_frequencies(sample_config):
     sample_config['traits'][0]['genotypes'][1]['initial_freq'] = 48
     sample_config['traits'][0]['genotypes'][2]['initial_freq'] = 16
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(sample_config, f)
-        config_path = f.name
-    
-    try:
-        config = load_config(config_path)
-        # Frequencies should be normalized
-        total = sum(g['initial_freq'] for g in config.traits[0].genotypes)
-        assert abs(total - 1.0) < 0.001
-    finally:
-        Path(config_path).unlink()
+    config = load_config_from_dict(sample_config)
+    # Frequencies should be normalized
+    total = sum(g['initial_freq'] for g in config.traits[0].genotypes)
+    assert abs(total - 1.0) < 0.001
+
 
+def test_load_config_invalid_workers(sample_config):
+    """Test that a non-positive workers count raises error."""
+    sample_config['workers'] = 0
+    
+    with pytest.raises(ConfigurationError):
+        load_config_from_dict(sample_config)
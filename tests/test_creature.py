@@ -6,9 +6,9 @@ from gene_sim.models.creature import Creature
 from gene_sim.models.trait import Trait, Genotype, TraitType
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_traits():
-    """Create sample traits for testing."""
+    """Create sample traits for testing (read-only, shared across the module)."""
     return [
         Trait(0, "Coat Color", TraitType.SIMPLE_MENDELIAN, [
             Genotype("BB", "Black", 0.36),
@@ -45,6 +45,20 @@ def test_creature_creation(founder_creature):
     assert founder_creature.parent2_id is None
 
 
+def test_creature_is_slotted_and_picklable(founder_creature):
+    """Test creatures carry no per-instance dict and survive pickling (worker pool)."""
+    import pickle
+    
+    assert not hasattr(founder_creature, '__dict__')
+    with pytest.raises(AttributeError):
+        founder_creature.unknown_attribute = 1
+    
+    clone = pickle.loads(pickle.dumps(founder_creature))
+    assert clone.genome == founder_creature.genome
+    assert clone.sex == founder_creature.sex
+    assert clone.lifespan == founder_creature.lifespan
+
+
 def test_creature_founder_validation():
     """Test that founders must have no parents."""
     genome = [None] * 1
@@ -154,7 +168,21 @@ def test_creature_create_offspring(sample_traits):
     assert offspring.conception_cycle == 1
     assert offspring.parent1_id == 1
     assert offspring.parent2_id == 2
+    assert isinstance(offspring.genome, tuple)
     assert offspring.genome[0] in ["Bb", "bB", "BB", "bb"]
+    assert offspring.sexual_maturity_cycle == offspring.birth_cycle + 13
+    assert offspring.is_alive
+    assert offspring.creature_id is None
+    assert offspring.gestation_end_cycle is None
+    assert offspring.nursing_end_cycle is None
+    assert offspring.generation == 1
+    # Fertility window is 10 or 8 years of 28-day cycles, truncated
+    window = {'male': 130, 'female': 104}[offspring.sex]
+    assert offspring.max_fertility_age_cycle == offspring.birth_cycle + window
+    
+    # Everything after the parents is keyword-only
+    with pytest.raises(TypeError):
+        Creature.create_offspring(parent1, parent2, 1, 1, sample_traits, rng, config)
 
 
 def test_creature_relationship_coefficient():
@@ -171,6 +199,19 @@ def test_creature_relationship_coefficient():
     
     r = Creature.calculate_relationship_coefficient(child1, child2)
     assert r == 0.5  # Full siblings
+    
+    # Parent-offspring, in either argument order
+    assert Creature.calculate_relationship_coefficient(parent1, child1) == 0.5
+    assert Creature.calculate_relationship_coefficient(child2, parent2) == 0.5
+    
+    # Half-siblings, including a shared parent on opposite sides
+    half1 = Creature(1, birth_cycle=1, sex="male", genome=genome, parent1_id=1, parent2_id=5, creature_id=6)
+    half2 = Creature(1, birth_cycle=1, sex="female", genome=genome, parent1_id=7, parent2_id=2, creature_id=8)
+    assert Creature.calculate_relationship_coefficient(child1, half1) == 0.25
+    assert Creature.calculate_relationship_coefficient(half2, child2) == 0.25
+    
+    # Founders share no recorded parents
+    assert Creature.calculate_relationship_coefficient(parent1, parent2) == 0.0
 
 
 def test_creature_inbreeding_coefficient():
@@ -2,82 +2,87 @@
 
 import pytest
 import sqlite3
-import tempfile
-from pathlib import Path
 from gene_sim.database import create_database, get_db_connection
 from gene_sim.database.schema import create_schema, drop_schema
 
 
-def test_create_database():
-    """Test database creation."""
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-        db_path = f.name
+EXPECTED_TABLES = [
+    'simulations', 'traits', 'genotypes', 'creatures',
+    'creature_genotypes', 'generation_stats',
+    'generation_genotype_frequencies', 'generation_trait_stats'
+]
+
+
+def test_create_schema(memdb):
+    """Test that create_schema creates all tables."""
+    cursor = memdb.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    tables = [row[0] for row in cursor.fetchall()]
+    
+    for table in EXPECTED_TABLES:
+        assert table in tables
+
+
+def test_create_schema_indexes(memdb):
+    """Test that create_schema creates the documented creature genotype indexes."""
+    cursor = memdb.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='creature_genotypes'")
+    indexes = {row[0] for row in cursor.fetchall()}
     
+    assert {
+        'idx_creature_genotypes_trait',
+        'idx_creature_genotypes_genotype',
+        'idx_creature_genotypes_creature',
+    } <= indexes
+
+
+def test_create_database(tmp_path):
+    """Test database creation at a path on disk."""
+    db_path = tmp_path / 'nested' / 'test.db'
+    conn = create_database(str(db_path))
     try:
-        conn = create_database(db_path)
-        assert conn is not None
+        assert db_path.exists()
         
         # Check that tables exist
         cursor = conn.cursor()
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
         tables = [row[0] for row in cursor.fetchall()]
         
-        expected_tables = [
-            'simulations', 'traits', 'genotypes', 'creatures',
-            'creature_genotypes', 'generation_stats',
-            'generation_genotype_frequencies', 'generation_trait_stats'
-        ]
-        
-        for table in expected_tables:
+        for table in EXPECTED_TABLES:
             assert table in tables
-        
-        conn.close()
     finally:
-        Path(db_path).unlink()
+        conn.close()
 
 
-def test_schema_foreign_keys():
+def test_schema_foreign_keys(memdb):
     """Test that foreign keys are enforced."""
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-        db_path = f.name
+    cursor = memdb.cursor()
     
-    try:
-        conn = create_database(db_path)
-        cursor = conn.cursor()
-        
-        # Try to insert creature with invalid simulation_id
-        with pytest.raises(sqlite3.IntegrityError):
-            cursor.execute("""
-                INSERT INTO creatures (
-                    simulation_id, birth_cycle, lifespan
-                ) VALUES (999, 0, 10)
-            """)
-            conn.commit()
-        
-        conn.close()
-    finally:
-        try:
-            Path(db_path).unlink()
-        except PermissionError:
-            pass  # File may be locked on Windows
+    # Try to insert creature with invalid simulation_id
+    with pytest.raises(sqlite3.IntegrityError):
+        cursor.execute("""
+            INSERT INTO creatures (
+                simulation_id, birth_cycle, lifespan
+            ) VALUES (999, 0, 10)
+        """)
+        memdb.commit()
 
 
-def test_get_db_connection():
+def test_get_db_connection(tmp_path):
     """Test getting database connection."""
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-        db_path = f.name
-    
+    # WAL journaling needs a file-backed database
+    conn = get_db_connection(str(tmp_path / 'test.db'))
     try:
-        conn = get_db_connection(db_path)
-        assert conn is not None
-        
         # Check foreign keys are enabled
         cursor = conn.cursor()
         cursor.execute("PRAGMA foreign_keys")
         result = cursor.fetchone()
         assert result[0] == 1  # Foreign keys enabled
         
-        conn.close()
+        # Check write-friendly journaling is enabled
+        cursor.execute("PRAGMA journal_mode")
+        assert cursor.fetchone()[0] == 'wal'
+        cursor.execute("PRAGMA synchronous")
+        assert cursor.fetchone()[0] == 1  # NORMAL
     finally:
-        Path(db_path).unlink()
-
+        conn.close()
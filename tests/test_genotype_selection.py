@@ -1,10 +1,7 @@
 """Test that breeders selecting for a desired genotype increase its frequency."""
 
 import pytest
-import tempfile
-import yaml
 import sqlite3
-from pathlib import Path
 import numpy as np
 from gene_sim import Simulation
 from gene_sim.models.creature import Creature
@@ -53,23 +50,10 @@ def config_with_desired_genotype():
         ]
     }
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(config, f)
-        config_path = f.name
-    
-    yield config_path
-    
-    # Cleanup
-    Path(config_path).unlink()
-    config_dir = Path(config_path).parent
-    for db_file in config_dir.glob('simulation_*.db'):
-        try:
-            db_file.unlink()
-        except PermissionError:
-            pass  # File may be locked on Windows
+    return config
 
 
-def test_desired_genotype_increases_with_selection(config_with_desired_genotype):
+def test_desired_genotype_increases_with_selection(config_with_desired_genotype, tmp_path):
     """
     Test that when a breeder selects for a desired genotype, its frequency increases.
     
@@ -80,7 +64,7 @@ def test_desired_genotype_increases_with_selection(config_with_desired_genotype)
     - Assert population increases and desired genotype frequency increases
     """
     # Create simulation
-    sim = Simulation.from_config(config_with_desired_genotype)
+    sim = Simulation.from_dict(config_with_desired_genotype, str(tmp_path / 'simulation.db'))
     sim.initialize()
     
     # Get the trait to check phenotypes
@@ -162,8 +146,9 @@ def test_desired_genotype_increases_with_selection(config_with_desired_genotype)
         generation=0
     )
     
-    # Persist these creatures
-    sim.population._persist_creatures(sim.db_conn, sim.simulation_id, [male, female1, female2])
+    # Persist these creatures (one batch, committed as a single transaction)
+    with sim.db_conn:
+        sim.population._persist_creatures(sim.db_conn, sim.simulation_id, [male, female1, female2])
     
     # Add to population
     sim.population.add_creatures([male, female1, female2], current_cycle=0)
@@ -207,8 +192,13 @@ def test_desired_genotype_increases_with_selection(config_with_desired_genotype)
     assert len(eligible_males_start) > 0, f"No eligible males at cycle 0. Creatures: {len(sim.population.creatures)}"
     assert len(eligible_females_start) > 0, f"No eligible females at cycle 0. Creatures: {len(sim.population.creatures)}"
     
+    cursor = sim.db_conn.cursor()
+    total_births = 0
+    # One Cycle for the whole run, advanced like Simulation.run does, so its
+    # scratch arrays and caches carry over between cycles
+    cycle = Cycle(0)
     while cycles_run < max_cycles:
-        cycle = Cycle(cycles_run)
+        cycle.cycle_number = cycles_run
         cycle_stats = cycle.execute_cycle(
             sim.population,
             sim.breeders,
@@ -221,36 +211,40 @@ def test_desired_genotype_increases_with_selection(config_with_desired_genotype)
         
         cycles_run += 1
         
-        # Check total births from database
-        cursor = sim.db_conn.cursor()
-        cursor.execute("""
-            SELECT SUM(births) as total_births
-            FROM generation_stats
-            WHERE simulation_id = ?
-        """, (sim.simulation_id,))
-        result = cursor.fetchone()
-        total_births = result[0] if result[0] is not None else 0
-        
-        # Also check conceptions (offspring created but not yet born)
-        cursor.execute("""
-            SELECT COUNT(*) 
-            FROM creatures 
-            WHERE simulation_id = ? 
-            AND birth_cycle > 0 
-            AND birth_cycle > ?
-        """, (sim.simulation_id, cycles_run))
-        future_births = cursor.fetchone()[0]
+        # Running total of births (the same figure generation_stats records per cycle)
+        total_births += cycle_stats.births
         
         # If we've reached our target births, break
         if total_births >= target_births:
             break
         
         # If we've conceived enough offspring (even if not born yet), that's also acceptable
-        # We'll wait a bit more for them to be born
-        if future_births + total_births >= target_births and cycles_run >= gestation_cycles + 4:
-            # Run a few more cycles to let births occur
-            if cycles_run >= gestation_cycles + 8:
-                break
+        # We'll wait a bit more for them to be born. Conceptions are only counted once
+        # enough cycles have passed for this to matter.
+        if cycles_run >= gestation_cycles + 4:
+            cursor.execute("""
+                SELECT COUNT(*) 
+                FROM creatures 
+                WHERE simulation_id = ? 
+                AND birth_cycle > 0 
+                AND birth_cycle > ?
+            """, (sim.simulation_id, cycles_run))
+            future_births = cursor.fetchone()[0]
+            if future_births + total_births >= target_births:
+                # Run a few more cycles to let births occur
+                if cycles_run >= gestation_cycles + 8:
+                    break
+    
+    # Breeders keep no candidate pools (or the creatures in them) between cycles
+    assert all(breeder._pool_cache is None for breeder in sim.breeders)
+    
+    # generation_stats agrees with the running total
+    cursor.execute("""
+        SELECT SUM(births) as total_births
+        FROM generation_stats
+        WHERE simulation_id = ?
+    """, (sim.simulation_id,))
+    assert (cursor.fetchone()[0] or 0) == total_births
     
     # Verify we got at least 4 births (or conceptions that will become births)
     cursor.execute("""
@@ -1,10 +1,7 @@
 """Tests for offspring removal functionality."""
 
 import pytest
-import tempfile
-import yaml
 import sqlite3
-from pathlib import Path
 from gene_sim import Simulation
 
 
@@ -48,24 +45,12 @@ def config_with_removal():
         ]
     }
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(config, f)
-        config_path = f.name
-    
-    yield config_path
-    
-    Path(config_path).unlink()
-    config_dir = Path(config_path).parent
-    for db_file in config_dir.glob('simulation_*.db'):
-        try:
-            db_file.unlink()
-        except PermissionError:
-            pass  # File may be locked on Windows
+    return config
 
 
-def test_offspring_removal_persists_to_db(config_with_removal):
+def test_offspring_removal_persists_to_db(config_with_removal, tmp_path):
     """Test that removed offspring are persisted to database."""
-    sim = Simulation.from_config(config_with_removal)
+    sim = Simulation.from_dict(config_with_removal, str(tmp_path / 'simulation.db'))
     results = sim.run()
     
     conn = sqlite3.connect(results.database_path)
@@ -108,38 +93,27 @@ def test_offspring_removal_persists_to_db(config_with_removal):
     conn.close()
 
 
-def test_offspring_removal_rate_zero(config_with_removal):
+def test_offspring_removal_rate_zero(config_with_removal, tmp_path):
     """Test that removal rate of 0.0 doesn't remove any offspring."""
     # Modify config to have 0 removal rate
-    import yaml
-    with open(config_with_removal, 'r') as f:
-        config = yaml.safe_load(f)
-    config['creature_archetype']['offspring_removal_rate'] = 0.0
+    config_with_removal['creature_archetype']['offspring_removal_rate'] = 0.0
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(config, f)
-        config_path = f.name
+    sim = Simulation.from_dict(config_with_removal, str(tmp_path / 'simulation.db'))
+    results = sim.run()
     
-    try:
-        sim = Simulation.from_config(config_path)
-        results = sim.run()
-        
-        conn = sqlite3.connect(results.database_path)
-        cursor = conn.cursor()
-        
-        # Get total births
-        cursor.execute("""
-            SELECT SUM(births) as total_births
-            FROM generation_stats
-            WHERE simulation_id = ?
-        """, (results.simulation_id,))
-        total_births = cursor.fetchone()[0]
-        
-        # All births should be in final population (minus deaths)
-        # With removal rate 0, population should grow more
-        assert results.final_population_size >= total_births * 0.5
-        
-        conn.close()
-    finally:
-        Path(config_path).unlink()
-
+    conn = sqlite3.connect(results.database_path)
+    cursor = conn.cursor()
+    
+    # Get total births
+    cursor.execute("""
+        SELECT SUM(births) as total_births
+        FROM generation_stats
+        WHERE simulation_id = ?
+    """, (results.simulation_id,))
+    total_births = cursor.fetchone()[0]
+    
+    # All births should be in final population (minus deaths)
+    # With removal rate 0, population should grow more
+    assert results.final_population_size >= total_births * 0.5
+    
+    conn.close()
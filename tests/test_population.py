@@ -74,6 +74,18 @@ def test_population_get_aged_out_creatures(sample_creature):
     assert aged_out[0] == sample_creature
 
 
+def test_population_elapsed_lifespan_ages_out_next():
+    """Test that a creature added after its lifespan ended lands in the current slot."""
+    population = Population()
+    old = Creature(simulation_id=1, birth_cycle=0, sex="male", genome=["BB"], lifespan=3)
+    young = Creature(simulation_id=1, birth_cycle=5, sex="female", genome=["bb"], lifespan=4)
+    population.add_creatures([old, young], current_cycle=5)
+    
+    assert len(population.age_out) == 5
+    assert population.get_aged_out_creatures() == [old]
+    assert population.age_out[4] == [young]
+
+
 def test_population_calculate_genotype_frequencies(sample_creature):
     """Test calculating genotype frequencies."""
     population = Population()
@@ -111,3 +123,136 @@ def test_population_calculate_genotype_diversity(sample_creature):
     diversity = population.calculate_genotype_diversity(0)
     assert diversity == 2
 
+
+
+def test_population_calculate_trait_statistics_matches_per_trait_methods():
+    """Test that the single-pass trait statistics match the per-trait methods."""
+    population = Population()
+    trait = Trait(0, "Coat Color", TraitType.SIMPLE_MENDELIAN, [
+        Genotype("BB", "Black", 0.25),
+        Genotype("Bb", "Black", 0.50),
+        Genotype("bb", "Brown", 0.25),
+    ])
+    
+    creatures = [
+        Creature(1, 0, "male", ["BB"], lifespan=10),
+        Creature(1, 0, "female", ["Bb"], lifespan=10),
+        Creature(1, 0, "female", ["Bb"], lifespan=10),
+        Creature(1, 0, "male", ["bb"], lifespan=10),
+    ]
+    population.add_creatures(creatures, current_cycle=0)
+    
+    genotype_freqs, allele_freqs, heterozygosity, diversity = \
+        population.calculate_trait_statistics([trait])
+    
+    # Frequencies are keyed by trait_id; scalar stats are aligned with the traits list
+    assert genotype_freqs[0] == population.calculate_genotype_frequencies(0)
+    assert allele_freqs[0] == population.calculate_allele_frequencies(0, trait)
+    assert heterozygosity.tolist() == [population.calculate_heterozygosity(0)]
+    assert diversity.tolist() == [population.calculate_genotype_diversity(0)]
+    assert heterozygosity[0] == 0.5
+    assert allele_freqs[0] == {"B": 0.5, "b": 0.5}
+
+
+def test_population_trait_statistics_refresh_after_population_change():
+    """Test that cached trait statistics are recomputed when creatures are added."""
+    population = Population()
+    trait = Trait(0, "Coat Color", TraitType.SIMPLE_MENDELIAN, [
+        Genotype("BB", "Black", 0.5),
+        Genotype("bb", "Brown", 0.5),
+    ])
+    
+    population.add_creatures([Creature(1, 0, "male", ["BB"], lifespan=10)], current_cycle=0)
+    first = population.calculate_trait_statistics([trait])
+    assert population.calculate_trait_statistics([trait]) is first  # Unchanged population
+    assert first[0][0] == {"BB": 1.0}
+    
+    population.add_creatures([Creature(1, 0, "female", ["bb"], lifespan=10)], current_cycle=0)
+    second = population.calculate_trait_statistics([trait])
+    assert second[0][0] == {"BB": 0.5, "bb": 0.5}
+    assert second[3].tolist() == [2]
+
+
+def test_population_eligibility_tracks_direct_pool_changes(sample_config, sample_creature):
+    """Test that eligible creature lists stay correct when creatures is modified directly."""
+    population = Population()
+    female = Creature(simulation_id=1, birth_cycle=0, sex="female", genome=["bb"], lifespan=10)
+    population.add_creatures([sample_creature, female], current_cycle=0)
+    
+    assert population.get_eligible_males(0, sample_config) == [sample_creature]
+    assert population.get_eligible_females(0, sample_config) == [female]
+    
+    assert population.get_eligible_creatures(0, sample_config) == ([sample_creature], [female])
+    
+    population.creatures.clear()
+    assert population.get_eligible_males(0, sample_config) == []
+    assert population.get_eligible_females(0, sample_config) == []
+
+
+def test_population_genotype_counts_follow_removals():
+    """Test that statistics reflect creatures removed from the working pool."""
+    population = Population()
+    creatures = [
+        Creature(simulation_id=1, birth_cycle=0, sex="male", genome=["BB"], lifespan=10),
+        Creature(simulation_id=1, birth_cycle=0, sex="female", genome=["bb"], lifespan=10),
+    ]
+    for creature_id, creature in enumerate(creatures, start=1):
+        creature.creature_id = creature_id
+    population.add_creatures(creatures, current_cycle=0)
+    assert population.calculate_genotype_frequencies(0) == {"BB": 0.5, "bb": 0.5}
+    
+    # Age out the BB male
+    population.age_out = [[creatures[0]]]
+    population.remove_aged_out_creatures(db_conn=None, simulation_id=1)
+    
+    assert population.calculate_genotype_frequencies(0) == {"bb": 1.0}
+    assert population.calculate_genotype_diversity(0) == 1
+    assert population.calculate_heterozygosity(0) == 0.0
+
+
+def test_population_persist_creatures_assigns_database_ids(memdb):
+    """Test batch persistence hands each creature the ID of its own database row."""
+    memdb.execute("INSERT INTO simulations (seed, config) VALUES (1, '{}')")
+    memdb.execute("INSERT INTO traits (trait_id, name, trait_type) VALUES (0, 'Coat Color', 'SIMPLE_MENDELIAN')")
+    population = Population()
+    
+    first = [Creature(simulation_id=1, birth_cycle=0, sex="male", genome=["BB"], lifespan=10)]
+    population._persist_creatures(memdb, 1, first)
+    # AUTOINCREMENT never reuses a deleted ID, so the next batch starts after a gap
+    memdb.execute("DELETE FROM creatures")
+    
+    creatures = [
+        Creature(simulation_id=1, birth_cycle=0, sex="female", genome=[genotype], lifespan=lifespan)
+        for genotype, lifespan in [("Bb", 11), ("bb", 12), ("BB", 13)]
+    ]
+    population._persist_creatures(memdb, 1, creatures)
+    
+    rows = memdb.execute("""
+        SELECT c.creature_id, c.lifespan, g.genotype
+        FROM creatures c JOIN creature_genotypes g ON g.creature_id = c.creature_id
+        ORDER BY c.creature_id
+    """).fetchall()
+    assert rows == [(c.creature_id, c.lifespan, c.genome[0]) for c in creatures]
+    assert [c.creature_id for c in creatures] == [2, 3, 4]
+
+
+def test_population_genotype_frequencies_follow_additions():
+    """Test that cached per-trait counts are refreshed when creatures are added."""
+    population = Population()
+    population.add_creatures(
+        [Creature(simulation_id=1, birth_cycle=0, sex="male", genome=["BB"], lifespan=10)],
+        current_cycle=0
+    )
+    assert population.calculate_genotype_frequencies(0) == {"BB": 1.0}
+    assert population.calculate_genotype_frequencies(0) == {"BB": 1.0}
+    
+    population.add_creatures(
+        [Creature(simulation_id=1, birth_cycle=0, sex="female", genome=["Bb"], lifespan=10)],
+        current_cycle=0
+    )
+    assert population.calculate_genotype_frequencies(0) == {"BB": 0.5, "Bb": 0.5}
+    assert population.calculate_genotype_diversity(0) == 2
+    
+    # Replacing the pool directly is picked up as well
+    population.creatures = [population.creatures[1]]
+    assert population.calculate_genotype_frequencies(0) == {"Bb": 1.0}
@@ -1,66 +1,67 @@
 """Integration tests for Simulation."""
 
 import pytest
-import tempfile
 import yaml
-from pathlib import Path
 from gene_sim import Simulation
 
 
+SIMPLE_CONFIG = {
+    'seed': 42,
+    'years': 0.25,  # ~3 cycles with 28 day cycle
+    'initial_population_size': 20,
+    'initial_sex_ratio': {'male': 0.5, 'female': 0.5},
+    'creature_archetype': {
+        'lifespan': {'min': 12, 'max': 18},
+        'sexual_maturity_months': 12.0,
+        'max_fertility_age_years': {'male': 10.0, 'female': 8.0},
+        'gestation_period_days': 90.0,
+        'nursing_period_days': 60.0,
+        'menstrual_cycle_days': 28.0,
+        'nearing_end_cycles': 3,
+        'remove_ineligible_immediately': False,
+        'litter_size': {'min': 3, 'max': 6}
+    },
+    'breeders': {
+        'random': 5,
+        'inbreeding_avoidance': 0,
+        'kennel_club': 0,
+        'mill': 0
+    },
+    'traits': [
+        {
+            'trait_id': 0,
+            'name': 'Coat Color',
+            'trait_type': 'SIMPLE_MENDELIAN',
+            'genotypes': [
+                {'genotype': 'BB', 'phenotype': 'Black', 'initial_freq': 0.25},
+                {'genotype': 'Bb', 'phenotype': 'Black', 'initial_freq': 0.50},
+                {'genotype': 'bb', 'phenotype': 'Brown', 'initial_freq': 0.25},
+            ]
+        }
+    ]
+}
+
+
+def _write_config(directory) -> str:
+    """Write SIMPLE_CONFIG to config.yaml in directory and return its path."""
+    # Default database paths sit next to the config file, so every database the
+    # test creates lands in that directory and pytest cleans them up
+    config_path = directory / 'config.yaml'
+    config_path.write_text(yaml.dump(SIMPLE_CONFIG))
+    return str(config_path)
+
+
 @pytest.fixture
-def simple_config_file():
+def simple_config_file(tmp_path):
     """Create a simple config file for testing."""
-    config = {
-        'seed': 42,
-        'years': 0.25,  # ~3 cycles with 28 day cycle
-        'initial_population_size': 20,
-        'initial_sex_ratio': {'male': 0.5, 'female': 0.5},
-        'creature_archetype': {
-            'lifespan': {'min': 12, 'max': 18},
-            'sexual_maturity_months': 12.0,
-            'max_fertility_age_years': {'male': 10.0, 'female': 8.0},
-            'gestation_period_days': 90.0,
-            'nursing_period_days': 60.0,
-            'menstrual_cycle_days': 28.0,
-            'nearing_end_cycles': 3,
-            'remove_ineligible_immediately': False,
-            'litter_size': {'min': 3, 'max': 6}
-        },
-        'breeders': {
-            'random': 5,
-            'inbreeding_avoidance': 0,
-            'kennel_club': 0,
-            'mill': 0
-        },
-        'traits': [
-            {
-                'trait_id': 0,
-                'name': 'Coat Color',
-                'trait_type': 'SIMPLE_MENDELIAN',
-                'genotypes': [
-                    {'genotype': 'BB', 'phenotype': 'Black', 'initial_freq': 0.25},
-                    {'genotype': 'Bb', 'phenotype': 'Black', 'initial_freq': 0.50},
-                    {'genotype': 'bb', 'phenotype': 'Brown', 'initial_freq': 0.25},
-                ]
-            }
-        ]
-    }
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(config, f)
-        config_path = f.name
-    
-    yield config_path
-    
-    # Cleanup
-    Path(config_path).unlink()
-    # Also clean up any database files created
-    config_dir = Path(config_path).parent
-    for db_file in config_dir.glob('simulation_*.db'):
-        try:
-            db_file.unlink()
-        except PermissionError:
-            pass  # File may be locked on Windows
+    return _write_config(tmp_path)
+
+
+@pytest.fixture(scope='module')
+def simple_run(tmp_path_factory):
+    """Run the simple config once for the tests that only inspect a finished run."""
+    config_path = _write_config(tmp_path_factory.mktemp('simple_run'))
+    return config_path, Simulation.from_config(config_path).run()
 
 
 def test_simulation_from_config(simple_config_file):
@@ -71,10 +72,9 @@ def test_simulation_from_config(simple_config_file):
     assert sim.config.cycles > 0  # Should be calculated
 
 
-def test_simulation_run(simple_config_file):
+def test_simulation_run(simple_run):
     """Test running a complete simulation."""
-    sim = Simulation.from_config(simple_config_file)
-    results = sim.run()
+    _, results = simple_run
     
     assert results.status == 'completed'
     # 0.25 years * 365.25 / 28 ≈ 3 cycles
@@ -84,22 +84,36 @@ def test_simulation_run(simple_config_file):
     assert results.final_population_size >= 0
 
 
-def test_simulation_reproducibility(simple_config_file):
+def test_simulation_reproducibility(simple_run):
     """Test that same seed produces same results."""
-    sim1 = Simulation.from_config(simple_config_file)
-    results1 = sim1.run()
+    config_path, results1 = simple_run
     
-    sim2 = Simulation.from_config(simple_config_file)
+    # Only the results are compared, so the second run needs no database file
+    sim2 = Simulation.from_config(config_path, ':memory:')
     results2 = sim2.run()
     
     # Same seed should produce same final population size
     assert results1.final_population_size == results2.final_population_size
 
 
-def test_simulation_database_persistence(simple_config_file):
+def test_simulation_from_dict_matches_config_file(simple_config_file):
+    """Test that an in-memory config runs like the same config loaded from file."""
+    with open(simple_config_file) as f:
+        config = yaml.safe_load(f)
+    original = yaml.safe_dump(config)
+    
+    results_file = Simulation.from_config(simple_config_file, ':memory:').run()
+    results_dict = Simulation.from_dict(config, ':memory:').run()
+    
+    assert results_dict.final_population_size == results_file.final_population_size
+    assert results_dict.generations_completed == results_file.generations_completed
+    # The caller's dict is not normalized in place
+    assert yaml.safe_dump(config) == original
+
+
+def test_simulation_database_persistence(simple_run):
     """Test that simulation data is persisted to database."""
-    sim = Simulation.from_config(simple_config_file)
-    results = sim.run()
+    _, results = simple_run
     
     import sqlite3
     conn = sqlite3.connect(results.database_path)
@@ -122,3 +136,36 @@ def test_simulation_database_persistence(simple_config_file):
     
     conn.close()
 
+
+
+def test_simulation_parallel_offspring_independent_of_worker_count(simple_config_file, monkeypatch):
+    """Test that the offspring worker pool gives the same results for any worker count."""
+    import sqlite3
+    import gene_sim.models.generation as generation
+    
+    # Force the worker pool on for the handful of pairs in this small simulation
+    monkeypatch.setattr(generation, 'PARALLEL_OFFSPRING_MIN_PAIRS', 1)
+    monkeypatch.setattr(generation, 'PARALLEL_OFFSPRING_CHUNK_PAIRS', 2)
+    
+    with open(simple_config_file) as f:
+        config = yaml.safe_load(f)
+    
+    genotypes = []
+    for workers in (2, 3):
+        config['workers'] = workers
+        with open(simple_config_file, 'w') as f:
+            yaml.dump(config, f)
+        results = Simulation.from_config(simple_config_file).run()
+        assert results.status == 'completed'
+        
+        conn = sqlite3.connect(results.database_path)
+        genotypes.append(conn.execute("""
+            SELECT c.birth_cycle, c.sex, c.lifespan, g.genotype
+            FROM creatures c JOIN creature_genotypes g ON g.creature_id = c.creature_id
+            WHERE c.simulation_id = ?
+            ORDER BY c.creature_id
+        """, (results.simulation_id,)).fetchall())
+        conn.close()
+    
+    assert genotypes[0] == genotypes[1]
+    assert any(row[0] > 0 for row in genotypes[0])  # Offspring were created
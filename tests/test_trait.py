@@ -67,9 +67,44 @@ def test_trait_get_phenotype():
     assert trait.get_phenotype("BB") == "Black"
     assert trait.get_phenotype("Bb") == "Black"
     assert trait.get_phenotype("bb") == "Brown"
+    # Lookups match configured spellings exactly
+    assert trait.get_phenotype("bB") is None
     assert trait.get_phenotype("XX") is None
 
 
+def test_trait_get_phenotype_sex_linked():
+    """Test sex-linked phenotype lookup depends on sex."""
+    genotypes = [
+        Genotype("XBY", "Normal", 0.25, sex='male'),
+        Genotype("XbY", "Colorblind", 0.25, sex='male'),
+        Genotype("XBXB", "Normal", 0.25, sex='female'),
+        Genotype("XbXb", "Colorblind", 0.25, sex='female'),
+    ]
+    trait = Trait(0, "Vision", TraitType.SEX_LINKED, genotypes)
+    
+    assert trait.get_phenotype("XbY", 'male') == "Colorblind"
+    assert trait.get_phenotype("XBXB", 'female') == "Normal"
+    assert trait.get_phenotype("XbY", 'female') is None
+    assert trait.get_phenotype("XbY") is None
+
+
+def test_trait_genotype_index_and_intern():
+    """Test the genotype index and interning onto the trait's own strings."""
+    genotypes = [
+        Genotype("BB", "Black", 0.36),
+        Genotype("Bb", "Black", 0.48),
+        Genotype("bb", "Brown", 0.16),
+    ]
+    trait = Trait(0, "Coat Color", TraitType.SIMPLE_MENDELIAN, genotypes)
+    
+    assert trait.idx_to_genotype == ("BB", "Bb", "bb")
+    assert trait.genotype_to_idx["bb"] == 2
+    
+    built = "".join(["b", "B"][::-1])
+    assert trait.intern_genotype(built) is trait.idx_to_genotype[1]
+    assert trait.intern_genotype("XX") == "XX"
+
+
 def test_trait_get_genotype_by_frequency():
     """Test sampling genotype by frequency."""
     genotypes = [
@@ -83,6 +118,58 @@ def test_trait_get_genotype_by_frequency():
     assert sampled in trait.genotypes
 
 
+def test_trait_sample_many():
+    """Test batched sampling returns genotype indices following the frequencies."""
+    genotypes = [
+        Genotype("BB", "Black", 0.0),
+        Genotype("Bb", "Black", 0.25),
+        Genotype("bb", "Brown", 0.75),
+    ]
+    trait = Trait(0, "Test", TraitType.SIMPLE_MENDELIAN, genotypes)
+    
+    rng = np.random.Generator(np.random.PCG64(42))
+    indices = trait.sample_many(rng, 1000)
+    assert len(indices) == 1000
+    assert set(indices.tolist()) <= {1, 2}
+    assert 0.65 < np.mean(indices == 2) < 0.85
+
+
+def test_trait_sample_many_matches_choice():
+    """Test batched sampling draws the same genotypes as Generator.choice with p."""
+    genotypes = [
+        Genotype("BB", "Black", 0.36),
+        Genotype("Bb", "Black", 0.48),
+        Genotype("bb", "Brown", 0.16),
+    ]
+    trait = Trait(0, "Test", TraitType.SIMPLE_MENDELIAN, genotypes)
+    
+    batched = trait.sample_many(np.random.Generator(np.random.PCG64(7)), 500)
+    rng = np.random.Generator(np.random.PCG64(7))
+    one_by_one = [rng.choice(3, p=[0.36, 0.48, 0.16]) for _ in range(500)]
+    assert batched.tolist() == one_by_one
+    
+    rng = np.random.Generator(np.random.PCG64(7))
+    scalar = [trait.get_genotype_by_frequency(rng) for _ in range(500)]
+    assert [trait.genotypes.index(g) for g in scalar] == one_by_one
+
+
+def test_trait_cross():
+    """Test cross tables follow gamete order and reuse the trait's genotype strings."""
+    genotypes = [
+        Genotype("BB", "Black", 0.25),
+        Genotype("Bb", "Black", 0.50),
+        Genotype("bb", "Brown", 0.25),
+    ]
+    trait = Trait(0, "Test", TraitType.SIMPLE_MENDELIAN, genotypes)
+    
+    table = trait.cross("Bb", "bb")
+    assert table == (("Bb", "Bb"), ("bb", "bb"))
+    assert table[0][0] is trait.idx_to_genotype[1]
+    assert trait.cross("Bb", "bb") is table
+    assert trait.cross("bB", "Bb") == (("Bb", "bb"), ("BB", "Bb"))
+    assert trait.cross("H1H1_H2h2", "H1h1_H2H2") is None
+
+
 def test_trait_from_config():
     """Test creating Trait from config."""
     config = {